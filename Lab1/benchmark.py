@@ -0,0 +1,31 @@
+import sys
+import time
+
+import genetic
+from bioinspired.genetic import GeneticAlgorithm
+
+# --- Benchmark: generations/second, list-based GA vs vectorized GA ---
+# python benchmark.py [POP_SIZE ...]
+POP_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+GENS = 5
+
+def time_list_ga(pop_size):
+    genetic.POP_SIZE = pop_size
+    genetic.GENS = GENS
+    start = time.perf_counter()
+    genetic.genetic_algorithm(verbose=False)
+    return GENS / (time.perf_counter() - start)
+
+def time_numpy_ga(pop_size):
+    start = time.perf_counter()
+    GeneticAlgorithm(pop_size=pop_size, max_iter=GENS, rng=0).run()
+    return GENS / (time.perf_counter() - start)
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or POP_SIZES
+    GeneticAlgorithm(pop_size=10, max_iter=1).run()  # warm up NumPy before timing
+    print(f"{'POP_SIZE':>10} {'list gen/s':>12} {'numpy gen/s':>12} {'speedup':>8}")
+    for pop_size in sizes:
+        list_rate = time_list_ga(pop_size)
+        numpy_rate = time_numpy_ga(pop_size)
+        print(f"{pop_size:>10} {list_rate:>12.2f} {numpy_rate:>12.2f} {numpy_rate / list_rate:>7.1f}x")
@@ -1,5 +1,12 @@
 import random
 import math
+import os
+import sys
+
+# The vectorized engines live in the bioinspired package at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bioinspired.genetic import GeneticAlgorithm
 
 # --- Step 1: Define the problem ---
 # Function to optimize (maximize)
@@ -44,7 +51,21 @@ def mutate(x):
     return x
 
 # --- Step 8: Run the Genetic Algorithm ---
-def genetic_algorithm():
+def genetic_algorithm(vectorized=False, verbose=True, seed=None):
+    if vectorized:
+        # Vectorized engine from the bioinspired package
+        result = GeneticAlgorithm(pop_size=POP_SIZE, max_iter=GENS, cross_rate=CROSS_RATE, mut_rate=MUT_RATE,
+                                  lower=X_BOUND[0], upper=X_BOUND[1], rng=seed).run(verbose=verbose)
+        best_solution, best_fitness = float(result.best_position[0]), result.best_fitness
+        if verbose:
+            print("\n=== Final Result ===")
+            print(f"Best solution x = {best_solution:.5f}")
+            print(f"Best fitness = {best_fitness:.5f}")
+        return best_solution, best_fitness
+
+    # The reference code draws from the global random state
+    if seed is not None:
+        random.seed(seed)
     population = create_population()
     best_solution = None
     best_fitness = float('-inf')
@@ -72,13 +93,18 @@ def genetic_algorithm():
 
         population = children
 
-        print(f"Generation {generation+1}: Best Fitness = {best_fitness:.5f}")
+        if verbose:
+            print(f"Generation {generation+1}: Best Fitness = {best_fitness:.5f}")
 
     # --- Step 9: Output the Best Solution ---
-    print("\n=== Final Result ===")
-    print(f"Best solution x = {best_solution:.5f}")
-    print(f"Best fitness = {best_fitness:.5f}")
+    if verbose:
+        print("\n=== Final Result ===")
+        print(f"Best solution x = {best_solution:.5f}")
+        print(f"Best fitness = {best_fitness:.5f}")
+    return best_solution, best_fitness
 
 # --- Run the GA ---
+# python genetic.py          -> list-based GA
+# python genetic.py --numpy  -> vectorized GA
 if __name__ == "__main__":
-    genetic_algorithm()
+    genetic_algorithm(vectorized="--numpy" in sys.argv)
@@ -1,5 +1,12 @@
 import random
 import math
+import os
+import sys
+
+# The vectorized engines live in the bioinspired package at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bioinspired.swarm import ParticleSwarm
 
 # --- Step 1: Define the problem (objective function) ---
 def fitness_function(x):
@@ -23,7 +30,22 @@ class Particle:
         self.best_fitness = fitness_function(self.position)
 
 # --- Step 4–6: PSO Algorithm ---
-def particle_swarm_optimization():
+def particle_swarm_optimization(vectorized=False, verbose=True, seed=None):
+    if vectorized:
+        # Structure-of-arrays swarm from the bioinspired package
+        result = ParticleSwarm(num_particles=NUM_PARTICLES, max_iter=MAX_ITER, w=W, c1=C1, c2=C2,
+                               lower=X_BOUND[0], upper=X_BOUND[1], v_max=V_MAX, rng=seed).run(verbose=verbose)
+        global_best_position, global_best_fitness = float(result.best_position[0]), result.best_fitness
+        if verbose:
+            print("\n=== Final Result ===")
+            print(f"Best Position (x): {global_best_position:.5f}")
+            print(f"Best Fitness: {global_best_fitness:.5f}")
+        return global_best_position, global_best_fitness
+
+    # The reference code draws from the global random state
+    if seed is not None:
+        random.seed(seed)
+
     # Initialize the swarm
     swarm = [Particle() for _ in range(NUM_PARTICLES)]
     
@@ -73,13 +95,18 @@ def particle_swarm_optimization():
             elif particle.position > X_BOUND[1]:
                 particle.position = X_BOUND[1]
         
-        print(f"Iteration {iteration+1}: Global Best Fitness = {global_best_fitness:.5f}")
+        if verbose:
+            print(f"Iteration {iteration+1}: Global Best Fitness = {global_best_fitness:.5f}")
     
     # --- Step 7: Output the best solution ---
-    print("\n=== Final Result ===")
-    print(f"Best Position (x): {global_best_position:.5f}")
-    print(f"Best Fitness: {global_best_fitness:.5f}")
+    if verbose:
+        print("\n=== Final Result ===")
+        print(f"Best Position (x): {global_best_position:.5f}")
+        print(f"Best Fitness: {global_best_fitness:.5f}")
+    return global_best_position, global_best_fitness
 
 # --- Run PSO ---
+# python swarm.py          -> one Particle object per particle
+# python swarm.py --numpy  -> structure-of-arrays swarm
 if __name__ == "__main__":
-    particle_swarm_optimization()
+    particle_swarm_optimization(vectorized="--numpy" in sys.argv)
@@ -1,5 +1,19 @@
-import math
+import argparse
+import contextlib
+import os
 import random
+import sys
+
+# The scalable engine lives in the bioinspired package at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+
+from bioinspired.aco import AntColonyOptimizer
+from bioinspired.checkpoint import load_checkpoint
+from bioinspired.profiling import profile
+from bioinspired.distances import DenseDistance, distance_provider
+from bioinspired.tsplib import load_tour, load_tsp
 
 # --- Step 1: Define the Problem (Cities and Distances) ---
 cities = {
@@ -12,14 +26,13 @@ cities = {
 
 NUM_CITIES = len(cities)
 
+# Distances are read through a provider (see bioinspired/distances.py);
+# the demo cities fit in a dense float32 matrix
+distances = DenseDistance.from_coords([cities[c] for c in range(NUM_CITIES)])
+
 # Distance between two cities
 def distance(city1, city2):
-    x1, y1 = cities[city1]
-    x2, y2 = cities[city2]
-    return math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
-
-# Create a distance matrix for fast lookup
-dist_matrix = [[distance(i, j) for j in range(NUM_CITIES)] for i in range(NUM_CITIES)]
+    return float(distances.pairs(city1, city2))
 
 # --- Step 2: Initialize Parameters ---
 NUM_ANTS = 10
@@ -40,7 +53,8 @@ def select_next_city(ant_path, current_city):
 
     # Calculate probability for each unvisited city
     pheromone_values = [pheromone[current_city][j] ** ALPHA for j in unvisited]
-    heuristic_values = [(1 / dist_matrix[current_city][j]) ** BETA for j in unvisited]
+    row = distances.row(current_city)
+    heuristic_values = [(1 / row[j]) ** BETA for j in unvisited]
     combined = [pheromone_values[i] * heuristic_values[i] for i in range(len(unvisited))]
 
     total = sum(combined)
@@ -71,7 +85,7 @@ def construct_solution():
 
 # Calculate total distance of a tour
 def tour_length(path):
-    return sum(dist_matrix[path[i]][path[i+1]] for i in range(len(path) - 1))
+    return distances.tour_length(path)
 
 # --- Step 4: Update Pheromones ---
 def update_pheromones(all_paths):
@@ -93,7 +107,22 @@ def update_pheromones(all_paths):
             pheromone[b][a] += contribution  # symmetric
 
 # --- Step 5: Iterate the Process ---
-def ant_colony_optimization():
+def ant_colony_optimization(vectorized=False, batched=False, verbose=True, seed=None):
+    if vectorized:
+        # Scalable engine from the bioinspired package
+        colony = AntColonyOptimizer(distances, num_ants=NUM_ANTS, alpha=ALPHA, beta=BETA, rho=RHO, q=Q,
+                                    max_iter=ITERATIONS, batched=batched, rng=seed)
+        result = colony.run(verbose=verbose)
+        best_path, best_length = result.best_position.tolist(), result.best_fitness
+        if verbose:
+            print("\n=== Final Best Route Found ===")
+            print(" -> ".join(map(str, best_path)))
+            print(f"Shortest Distance: {best_length:.4f}")
+        return best_path, best_length
+
+    # The reference code draws from the global random state
+    if seed is not None:
+        random.seed(seed)
     best_path = None
     best_length = float('inf')
 
@@ -110,13 +139,67 @@ def ant_colony_optimization():
 
         update_pheromones(all_paths)
 
-        print(f"Iteration {iteration+1}: Best Length = {best_length:.4f}")
+        if verbose:
+            print(f"Iteration {iteration+1}: Best Length = {best_length:.4f}")
 
     # --- Step 6: Output the Best Solution ---
+    if verbose:
+        print("\n=== Final Best Route Found ===")
+        print(" -> ".join(map(str, best_path)))
+        print(f"Shortest Distance: {best_length:.4f}")
+    return best_path, best_length
+
+# --- Run the Algorithm ---
+# python ant.py                       -> list-based ACO on the demo cities
+# python ant.py --numpy               -> scalable engine
+# python ant.py --batch               -> scalable engine, all ants in lockstep
+# python ant.py a280.tsp --opt a280.opt.tour --distances mmap --storage mmap
+# python ant.py a280.tsp --opt a280.opt.tour --local-search
+# python ant.py a280.tsp --checkpoint run/ [--resume]   -> save every 10 iterations, pick up after a crash
+def main():
+    parser = argparse.ArgumentParser(description="Ant colony optimization for the TSP")
+    parser.add_argument("tsp", nargs="?", help="TSPLIB .tsp file (default: the demo cities)")
+    parser.add_argument("--opt", help="TSPLIB .opt.tour file, to report the gap to the optimum")
+    parser.add_argument("--numpy", action="store_true", help="use the scalable engine")
+    parser.add_argument("--batch", action="store_true", help="advance all ants in lockstep")
+    parser.add_argument("--local-search", action="store_true", help="2-opt/Or-opt every tour")
+    parser.add_argument("--distances", choices=["dense", "mmap", "euclidean"], default="dense")
+    parser.add_argument("--storage", choices=["dense", "mmap"], default="dense",
+                        help="where the pheromone matrices live")
+    parser.add_argument("--ants", type=int, default=NUM_ANTS)
+    parser.add_argument("--iterations", type=int, default=ITERATIONS)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--checkpoint", help="directory to save the colony state to")
+    parser.add_argument("--checkpoint-every", type=int, default=10)
+    parser.add_argument("--resume", action="store_true", help="continue from --checkpoint")
+    parser.add_argument("--profile", action="store_true", help="print the time spent in each phase")
+    args = parser.parse_args()
+    if args.resume and args.checkpoint is None:
+        parser.error("--resume needs --checkpoint")
+
+    if args.tsp is None:
+        ant_colony_optimization(vectorized=args.numpy or args.batch, batched=args.batch, seed=args.seed)
+        return
+
+    instance = load_tsp(args.tsp)
+    provider = distance_provider(instance, args.distances)
+    colony = AntColonyOptimizer(provider, num_ants=args.ants, max_iter=args.iterations, batched=args.batch,
+                                storage=args.storage, local_search=args.local_search, rng=args.seed)
+    if args.resume:
+        load_checkpoint(colony, args.checkpoint)
+    with profile(colony) if args.profile else contextlib.nullcontext() as profiler:
+        result = colony.run(verbose=True, checkpoint=args.checkpoint, checkpoint_every=args.checkpoint_every)
+    best_length = result.best_fitness
     print("\n=== Final Best Route Found ===")
-    print(" -> ".join(map(str, best_path)))
+    print(" -> ".join(map(str, result.best_position)))
     print(f"Shortest Distance: {best_length:.4f}")
+    if args.opt:
+        tour = load_tour(args.opt)
+        optimum = provider.tour_length(np.append(tour, tour[0]))
+        print(f"Optimal Distance: {optimum:.4f} (gap {100 * (best_length / optimum - 1):.2f}%)")
+    if profiler is not None:
+        print()
+        print(profiler.format_report())
 
-# --- Run the Algorithm ---
 if __name__ == "__main__":
-    ant_colony_optimization()
+    main()
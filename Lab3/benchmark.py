@@ -0,0 +1,52 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+
+from bioinspired.aco import AntColonyOptimizer
+from bioinspired.distances import distance_provider
+from bioinspired.tsplib import load_tour, load_tsp
+
+# --- Benchmark: wall-clock time to a target gap, with and without local search ---
+# python benchmark.py a280.tsp a280.opt.tour --gap 5 --time-limit 300
+def time_to_gap(provider, optimum, target_gap, time_limit, local_search, num_ants, seed):
+    colony = AntColonyOptimizer(provider, num_ants=num_ants, local_search=local_search, rng=seed)
+    start = time.perf_counter()
+    iterations = 0
+    while True:
+        colony.step()
+        iterations += 1
+        elapsed = time.perf_counter() - start
+        gap = 100 * (colony.best_fitness / optimum - 1)
+        if gap <= target_gap or elapsed >= time_limit:
+            return elapsed, iterations, gap
+
+def main():
+    parser = argparse.ArgumentParser(description="ACO time-to-target-gap benchmark")
+    parser.add_argument("tsp", nargs="+", help="TSPLIB .tsp file followed by its .opt.tour (repeatable)")
+    parser.add_argument("--gap", type=float, default=5.0, help="target gap to the optimum, in percent")
+    parser.add_argument("--time-limit", type=float, default=300.0, help="seconds per run")
+    parser.add_argument("--ants", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if len(args.tsp) % 2:
+        parser.error("expected .tsp/.opt.tour pairs")
+
+    print(f"{'instance':>12} {'local search':>12} {'seconds':>9} {'iterations':>10} {'gap %':>7}")
+    for tsp_path, tour_path in zip(args.tsp[::2], args.tsp[1::2]):
+        instance = load_tsp(tsp_path)
+        provider = distance_provider(instance)
+        tour = load_tour(tour_path)
+        optimum = provider.tour_length(np.append(tour, tour[0]))
+        for local_search in (False, True):
+            elapsed, iterations, gap = time_to_gap(provider, optimum, args.gap, args.time_limit,
+                                                   local_search, args.ants, args.seed)
+            reached = "" if gap <= args.gap else " (not reached)"
+            print(f"{instance.name:>12} {str(local_search):>12} {elapsed:>9.2f} {iterations:>10} {gap:>7.2f}{reached}")
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,13 @@
 import numpy as np
 import math
 import random
+import os
+import sys
+
+# The vectorized engines live in the bioinspired package at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bioinspired.cuckoo import CuckooSearch
 
 # --- Step 1: Define the Problem ---
 def fitness_function(x):
@@ -47,7 +54,21 @@ def abandon_nests(nests, fitness):
     return nests
 
 # --- Step 7: Iterate ---
-def cuckoo_search():
+def cuckoo_search(vectorized=False, verbose=True, seed=None):
+    if vectorized:
+        # Vectorized engine from the bioinspired package
+        result = CuckooSearch(num_nests=NUM_NESTS, pa=PA, max_iter=MAX_ITER,
+                              lower=X_BOUND[0], upper=X_BOUND[1], rng=seed).run(verbose=verbose)
+        best_nest, best_fitness = float(result.best_position[0]), result.best_fitness
+        if verbose:
+            print("\n=== Final Result ===")
+            print(f"Best solution x = {best_nest:.5f}")
+            print(f"Best fitness = {best_fitness:.5f}")
+        return best_nest, best_fitness
+
+    # The reference code draws from the global np.random state
+    if seed is not None:
+        np.random.seed(seed)
     nests = initialize_nests()
     fitness = evaluate_fitness(nests)
     
@@ -75,13 +96,18 @@ def cuckoo_search():
             best_fitness = fitness[current_best_index]
             best_nest = nests[current_best_index]
         
-        print(f"Iteration {iteration+1}: Best Fitness = {best_fitness:.5f}")
+        if verbose:
+            print(f"Iteration {iteration+1}: Best Fitness = {best_fitness:.5f}")
     
     # --- Step 8: Output the Best Solution ---
-    print("\n=== Final Result ===")
-    print(f"Best solution x = {best_nest:.5f}")
-    print(f"Best fitness = {best_fitness:.5f}")
+    if verbose:
+        print("\n=== Final Result ===")
+        print(f"Best solution x = {best_nest:.5f}")
+        print(f"Best fitness = {best_fitness:.5f}")
+    return best_nest, best_fitness
 
 # --- Run the Algorithm ---
+# python cukcoo.py          -> one nest at a time
+# python cukcoo.py --numpy  -> vectorized engine
 if __name__ == "__main__":
-    cuckoo_search()
+    cuckoo_search(vectorized="--numpy" in sys.argv)
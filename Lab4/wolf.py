@@ -1,6 +1,13 @@
 import numpy as np
 import math
 import random
+import os
+import sys
+
+# The vectorized engines live in the bioinspired package at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bioinspired.wolf import GreyWolfOptimizer
 
 # --- Step 1: Define the Problem ---
 def fitness_function(x):
@@ -13,15 +20,31 @@ MAX_ITER = 50           # number of iterations
 X_BOUND = [0, 1]        # search space bounds
 
 # --- Step 3: Initialize Population ---
-wolves = np.random.uniform(X_BOUND[0], X_BOUND[1], NUM_WOLVES)
+def init_wolves():
+    return np.random.uniform(X_BOUND[0], X_BOUND[1], NUM_WOLVES)
 
 # --- Step 4: Evaluate Fitness Function ---
 def evaluate_fitness(wolves):
     return np.array([fitness_function(x) for x in wolves])
 
 # --- Step 5: GWO Algorithm ---
-def grey_wolf_optimizer():
-    global wolves
+def grey_wolf_optimizer(vectorized=False, verbose=True, seed=None):
+    if vectorized:
+        # Vectorized engine from the bioinspired package
+        result = GreyWolfOptimizer(num_wolves=NUM_WOLVES, max_iter=MAX_ITER,
+                                   lower=X_BOUND[0], upper=X_BOUND[1], rng=seed).run(verbose=verbose)
+        alpha_pos, alpha_score = float(result.best_position[0]), result.best_fitness
+        if verbose:
+            print("\n=== Final Result ===")
+            print(f"Best position (x): {alpha_pos:.5f}")
+            print(f"Best fitness: {alpha_score:.5f}")
+        return alpha_pos, alpha_score
+
+    # The reference code draws from the global random and np.random states
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed)
+    wolves = init_wolves()
 
     # Initialize alpha, beta, delta wolves
     fitness = evaluate_fitness(wolves)
@@ -76,13 +99,18 @@ def grey_wolf_optimizer():
         alpha_pos, beta_pos, delta_pos = wolves[sorted_indices[:3]]
         alpha_score, beta_score, delta_score = fitness[sorted_indices[:3]]
 
-        print(f"Iteration {iteration+1}: Best Fitness = {alpha_score:.5f}")
+        if verbose:
+            print(f"Iteration {iteration+1}: Best Fitness = {alpha_score:.5f}")
 
     # --- Step 7: Output the Best Solution ---
-    print("\n=== Final Result ===")
-    print(f"Best position (x): {alpha_pos:.5f}")
-    print(f"Best fitness: {alpha_score:.5f}")
+    if verbose:
+        print("\n=== Final Result ===")
+        print(f"Best position (x): {alpha_pos:.5f}")
+        print(f"Best fitness: {alpha_score:.5f}")
+    return alpha_pos, alpha_score
 
 # --- Run GWO ---
+# python wolf.py          -> one wolf at a time
+# python wolf.py --numpy  -> vectorized engine
 if __name__ == "__main__":
-    grey_wolf_optimizer()
+    grey_wolf_optimizer(vectorized="--numpy" in sys.argv)
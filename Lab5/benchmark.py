@@ -0,0 +1,72 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+
+from bioinspired.objectives import sine_wave
+from bioinspired.wolf import GreyWolfOptimizer
+
+# --- Benchmark: per-wolf loop vs vectorized GWO ---
+# python benchmark.py [NUM_WOLVES N_DIMS ITERATIONS]
+NUM_WOLVES = 10_000
+N_DIMS = 100
+ITERATIONS = 5
+X_BOUND = [0, 1]
+
+def loop_iteration(wolves, leaders, a):
+    # The grey_wolf_optimizer loop body, applied to (num_wolves, n_dims) wolves
+    alpha_pos, beta_pos, delta_pos = leaders
+    for i in range(len(wolves)):
+        r1, r2 = random.random(), random.random()
+        A1 = 2 * a * r1 - a
+        C1 = 2 * r2
+        X1 = alpha_pos - A1 * abs(C1 * alpha_pos - wolves[i])
+
+        r1, r2 = random.random(), random.random()
+        A2 = 2 * a * r1 - a
+        C2 = 2 * r2
+        X2 = beta_pos - A2 * abs(C2 * beta_pos - wolves[i])
+
+        r1, r2 = random.random(), random.random()
+        A3 = 2 * a * r1 - a
+        C3 = 2 * r2
+        X3 = delta_pos - A3 * abs(C3 * delta_pos - wolves[i])
+
+        wolves[i] = np.clip((X1 + X2 + X3) / 3, X_BOUND[0], X_BOUND[1])
+
+    fitness = sine_wave(wolves)
+    sorted_indices = np.argsort(-fitness)
+    return wolves[sorted_indices[:3]]
+
+def time_loop(num_wolves, n_dims, iterations):
+    rng = np.random.default_rng(0)
+    wolves = rng.uniform(X_BOUND[0], X_BOUND[1], (num_wolves, n_dims))
+    leaders = wolves[np.argsort(-sine_wave(wolves))[:3]]
+    start = time.perf_counter()
+    for iteration in range(iterations):
+        leaders = loop_iteration(wolves, leaders, 2 - iteration * (2 / iterations))
+    return (time.perf_counter() - start) / iterations
+
+def time_vectorized(num_wolves, n_dims, iterations):
+    gwo = GreyWolfOptimizer(num_wolves=num_wolves, dimensions=n_dims, lower=X_BOUND[0], upper=X_BOUND[1],
+                            max_iter=iterations, rng=0)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        gwo.step()
+    return (time.perf_counter() - start) / iterations
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        num_wolves, n_dims, iterations = (int(arg) for arg in sys.argv[1:4])
+    else:
+        num_wolves, n_dims, iterations = NUM_WOLVES, N_DIMS, ITERATIONS
+
+    loop = time_loop(num_wolves, n_dims, iterations)
+    vectorized = time_vectorized(num_wolves, n_dims, iterations)
+    print(f"{num_wolves} wolves x {n_dims} dims, {iterations} iterations")
+    print(f"loop:       {loop * 1000:9.2f} ms/iteration")
+    print(f"vectorized: {vectorized * 1000:9.2f} ms/iteration ({loop / vectorized:.1f}x)")
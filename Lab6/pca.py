@@ -1,4 +1,12 @@
 import numpy as np
+import os
+import sys
+
+# The cellular optimizer lives in the bioinspired package at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bioinspired.cellular import CellularOptimizer
+from bioinspired.telemetry import ConsoleSink
 
 # Step 1: Define the optimization function
 def objective_function(x):
@@ -14,13 +22,16 @@ lower_bound, upper_bound = -5.12, 5.12
 neighborhood = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # von Neumann neighborhood
 
 # Step 3: Initialize population (random positions)
-population = np.random.uniform(lower_bound, upper_bound, (grid_size[0], grid_size[1], dimensions))
-fitness = np.zeros((grid_size[0], grid_size[1]))
+def initialize_population():
+    return np.random.uniform(lower_bound, upper_bound, (grid_size[0], grid_size[1], dimensions))
 
 # Step 4: Evaluate fitness
-for i in range(grid_size[0]):
-    for j in range(grid_size[1]):
-        fitness[i, j] = objective_function(population[i, j])
+def evaluate_population(population):
+    fitness = np.zeros((grid_size[0], grid_size[1]))
+    for i in range(grid_size[0]):
+        for j in range(grid_size[1]):
+            fitness[i, j] = objective_function(population[i, j])
+    return fitness
 
 # Helper: Get neighbors for each cell
 def get_neighbors(i, j):
@@ -31,10 +42,10 @@ def get_neighbors(i, j):
     return neighbors
 
 # Step 5: Update rule (local interaction)
-def update_cell(i, j):
+def update_cell(population, fitness, i, j):
     current_pos = population[i, j]
     current_fit = fitness[i, j]
-    
+
     # Get best neighbor
     best_neighbor = current_pos
     best_fit = current_fit
@@ -42,35 +53,66 @@ def update_cell(i, j):
         if fitness[ni, nj] < best_fit:
             best_neighbor = population[ni, nj]
             best_fit = fitness[ni, nj]
-    
+
     # Move slightly toward the best neighbor (diffusion-like update)
     new_pos = current_pos + np.random.rand() * (best_neighbor - current_pos)
-    
+
     # Ensure boundaries
     new_pos = np.clip(new_pos, lower_bound, upper_bound)
     new_fit = objective_function(new_pos)
-    
+
     # Update if better
     if new_fit < current_fit:
         population[i, j] = new_pos
         fitness[i, j] = new_fit
 
 # Step 6: Iterate and update cells
-for t in range(iterations):
-    for i in range(grid_size[0]):
-        for j in range(grid_size[1]):
-            update_cell(i, j)
-    
-    # Track the best cell
+def cellular_optimization(vectorized=False, synchronous=False, sparse=False, verbose=True, seed=None):
+    if vectorized or synchronous or sparse:
+        # Neighbour index table engine from the bioinspired package
+        observers = [ConsoleSink(stride=10)] if verbose else []
+        result = CellularOptimizer(grid_size=grid_size, dimensions=dimensions, max_iter=iterations,
+                                   lower=lower_bound, upper=upper_bound, synchronous=synchronous,
+                                   sparse=sparse, rng=seed, observers=observers).run()
+        best_solution, best_fitness = result.best_position, result.best_fitness
+        if verbose:
+            print("\n=== Final Result ===")
+            print("Best Solution:", best_solution)
+            print("Best Fitness:", best_fitness)
+        return best_solution, best_fitness
+
+    # The reference code draws from the global np.random state
+    if seed is not None:
+        np.random.seed(seed)
+    population = initialize_population()
+    fitness = evaluate_population(population)
+
+    for t in range(iterations):
+        for i in range(grid_size[0]):
+            for j in range(grid_size[1]):
+                update_cell(population, fitness, i, j)
+
+        # Track the best cell
+        best_index = np.unravel_index(np.argmin(fitness), fitness.shape)
+        best_value = fitness[best_index]
+
+        if verbose and t % 10 == 0:
+            print(f"Iteration {t} -> Best Fitness: {best_value:.6f}")
+
+    # Step 7: Output best solution
     best_index = np.unravel_index(np.argmin(fitness), fitness.shape)
-    best_value = fitness[best_index]
-    
-    if t % 10 == 0:
-        print(f"Iteration {t} -> Best Fitness: {best_value:.6f}")
-
-# Step 7: Output best solution
-best_index = np.unravel_index(np.argmin(fitness), fitness.shape)
-best_solution = population[best_index]
-print("\n=== Final Result ===")
-print("Best Solution:", best_solution)
-print("Best Fitness:", objective_function(best_solution))
+    best_solution = population[best_index]
+    best_fitness = objective_function(best_solution)
+    if verbose:
+        print("\n=== Final Result ===")
+        print("Best Solution:", best_solution)
+        print("Best Fitness:", best_fitness)
+    return best_solution, best_fitness
+
+# python pca.py          -> one cell at a time
+# python pca.py --numpy  -> neighbour-table engine, asynchronous in-place sweep
+# python pca.py --sync   -> whole-grid synchronous update
+# add --sparse to sweep only the cells whose neighbourhood improved
+if __name__ == "__main__":
+    cellular_optimization(vectorized="--numpy" in sys.argv, synchronous="--sync" in sys.argv,
+                          sparse="--sparse" in sys.argv)
@@ -1,5 +1,12 @@
 import numpy as np
 import random
+import os
+import sys
+
+# The batched engine lives in the bioinspired package at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bioinspired.gene import GeneExpressionAlgorithm
 
 # Step 1: Define the problem (maximize this function)
 def objective_function(x):
@@ -50,32 +57,64 @@ def mutate(chromosome):
     return chromosome
 
 # Step 8–10: Main Evolution Loop
-population = init_population()
-best_solution, best_fitness = None, -np.inf
-
-for generation in range(GENERATIONS):
-    fitness, expressed = evaluate_fitness(population)
-    
-    # Track best
-    gen_best_idx = np.argmax(fitness)
-    if fitness[gen_best_idx] > best_fitness:
-        best_fitness = fitness[gen_best_idx]
-        best_solution = expressed[gen_best_idx]
-    
-    selected = selection(population, fitness)
-    
-    new_population = []
-    for i in range(0, POP_SIZE, 2):
-        parent1, parent2 = selected[i], selected[(i+1) % POP_SIZE]
-        child1, child2 = crossover(parent1, parent2)
-        new_population.append(mutate(child1))
-        new_population.append(mutate(child2))
-    
-    population = np.array(new_population)
-    
-    if generation % 10 == 0:
-        print(f"Generation {generation} → Best Fitness: {best_fitness:.5f}")
-
-print("\n=== Final Result ===")
-print(f"Best Solution (x): {best_solution}")
-print(f"Best Fitness: {best_fitness:.5f}")
+def gene_expression_algorithm(batched=False, verbose=True, seed=None):
+    if batched:
+        return gene_expression_algorithm_batched(verbose, seed)
+
+    # The reference code draws from the global np.random state
+    if seed is not None:
+        np.random.seed(seed)
+    population = init_population()
+    best_solution, best_fitness = None, -np.inf
+
+    for generation in range(GENERATIONS):
+        fitness, expressed = evaluate_fitness(population)
+        
+        # Track best
+        gen_best_idx = np.argmax(fitness)
+        if fitness[gen_best_idx] > best_fitness:
+            best_fitness = fitness[gen_best_idx]
+            best_solution = expressed[gen_best_idx]
+        
+        selected = selection(population, fitness)
+        
+        new_population = []
+        for i in range(0, POP_SIZE, 2):
+            parent1, parent2 = selected[i], selected[(i+1) % POP_SIZE]
+            child1, child2 = crossover(parent1, parent2)
+            new_population.append(mutate(child1))
+            new_population.append(mutate(child2))
+        
+        population = np.array(new_population)
+        
+        if verbose and generation % 10 == 0:
+            print(f"Generation {generation} → Best Fitness: {best_fitness:.5f}")
+
+    if verbose:
+        print("\n=== Final Result ===")
+        print(f"Best Solution (x): {best_solution}")
+        print(f"Best Fitness: {best_fitness:.5f}")
+    return best_solution, best_fitness
+
+# Batched reproduction into preallocated buffers (bioinspired package)
+def gene_expression_algorithm_batched(verbose=True, seed=None):
+    optimizer = GeneExpressionAlgorithm(pop_size=POP_SIZE, num_genes=NUM_GENES, max_iter=GENERATIONS,
+                                        mutation_rate=MUTATION_RATE, crossover_rate=CROSSOVER_RATE,
+                                        lower=LOWER_BOUND, upper=UPPER_BOUND, rng=seed)
+    for generation in range(GENERATIONS):
+        optimizer.step()
+        if verbose and generation % 10 == 0:
+            print(f"Generation {generation} → Best Fitness: {optimizer.best_fitness:.5f}")
+
+    best_solution = GeneExpressionAlgorithm.express(optimizer.best_position[None, :])[0]
+    best_fitness = optimizer.best_fitness
+    if verbose:
+        print("\n=== Final Result ===")
+        print(f"Best Solution (x): {best_solution}")
+        print(f"Best Fitness: {best_fitness:.5f}")
+    return best_solution, best_fitness
+
+# python Gene.py          -> per-pair crossover and per-gene mutation
+# python Gene.py --batch  -> batched reproduction into preallocated buffers
+if __name__ == "__main__":
+    gene_expression_algorithm(batched="--batch" in sys.argv)
@@ -0,0 +1,48 @@
+"""Bio-inspired optimizers from the lab experiments, as an importable library.
+
+Submodules are imported lazily on first attribute access, so
+``from bioinspired import GeneticAlgorithm`` loads only the GA and the
+shared core, not its siblings.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "Config": "core",
+    "BoxConfig": "core",
+    "Optimizer": "core",
+    "Result": "core",
+    "GeneticAlgorithm": "genetic",
+    "GeneticConfig": "genetic",
+    "ParticleSwarm": "swarm",
+    "SwarmConfig": "swarm",
+    "AntColonyOptimizer": "aco",
+    "AntConfig": "aco",
+    "CuckooSearch": "cuckoo",
+    "CuckooConfig": "cuckoo",
+    "GreyWolfOptimizer": "wolf",
+    "WolfConfig": "wolf",
+    "CellularOptimizer": "cellular",
+    "CellularConfig": "cellular",
+    "GeneExpressionAlgorithm": "gene",
+    "GeneConfig": "gene",
+    "SteadyStateGA": "steady_state",
+    "SteadyStateGeneExpression": "steady_state",
+    "AsyncParticleSwarm": "steady_state",
+    "IslandModel": "islands",
+    "Experiment": "experiments",
+    "run_replicas": "experiments",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,232 @@
+import sys
+import tempfile
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from .core import Config, Optimizer
+from .distances import DenseDistance, DistanceProvider, distance_provider, new_matrix, row_blocks
+from .local_search import LocalSearch
+
+# --- Ant colony optimization for the TSP (Lab 3) ---
+# Each ant keeps a boolean visited mask instead of scanning its path,
+# eta**beta is computed once, and tau**alpha * eta**beta is refreshed once
+# per update_pheromones. Next cities are drawn from the k nearest neighbours
+# of the current city; only when all of them are visited do we fall back to
+# a scan over every city, so a tour costs roughly O(n*k).
+# With batched=True all ants advance in lockstep instead (see construct_solutions).
+#
+# `distances` is a DistanceProvider (dense, memory-mapped or on-the-fly; see
+# distances.py) or an (n, 2) coordinate array. The pheromone, heuristic and
+# weight matrices are float32 and live in RAM (storage="dense") or in
+# memory-mapped files under storage_dir (storage="mmap"). Without a
+# storage_dir the colony makes one temporary directory for its files and
+# removes it in close() (or `with AntColonyOptimizer(...)`), or at the
+# latest when the colony is garbage-collected.
+#
+# With local_search=True every constructed tour is improved by 2-opt and
+# Or-opt moves on the candidate lists (see local_search.py) before it is
+# measured and deposits pheromone.
+
+@dataclass
+class AntConfig(Config):
+    num_ants: int = 10
+    alpha: float = 1.0          # importance of pheromone
+    beta: float = 5.0           # importance of heuristic (1/distance)
+    rho: float = 0.5            # pheromone evaporation rate
+    q: float = 100              # pheromone deposit factor
+    num_candidates: int = 15    # nearest-neighbour candidate list size
+    batched: bool = False
+    local_search: bool = False
+    storage: str = "dense"
+    storage_dir: Optional[str] = None
+
+class AntColonyOptimizer(Optimizer):
+    config_class = AntConfig
+    maximize = False
+    transient = Optimizer.transient + ("heuristic", "weights", "candidates")
+    resume_overrides = Optimizer.resume_overrides + ("storage", "storage_dir")
+    phases = ("construct_solution", "construct_solutions", "local_search", "evaluate", "update_pheromones",
+              "refresh_weights")
+
+    def __init__(self, distances, config=None, *, rng=None, observers=None, **overrides):
+        if not isinstance(distances, DistanceProvider):
+            distances = DenseDistance.from_coords(distances)
+        self.distances = distances
+        self.num_cities = distances.num_cities
+        super().__init__(config, rng=rng, observers=observers, **overrides)
+
+    def setup(self):
+        c = self.config
+        n = self.num_cities
+        directory = c.storage_dir
+        self.scratch = None
+        if c.storage == "mmap" and directory is None:
+            self.scratch = tempfile.TemporaryDirectory(prefix="aco-")
+            directory = self.scratch.name
+        self.pheromone = new_matrix(n, 1.0, c.storage, directory, "pheromone")
+        self.heuristic = new_matrix(n, 0.0, c.storage, directory, "heuristic")
+        self.weights = new_matrix(n, 0.0, c.storage, directory, "weights")
+
+        # Heuristic eta**beta; the diagonal (and any coincident cities) get 0
+        for block in row_blocks(n):
+            d = np.array(self.distances.rows(np.arange(block.start, block.stop)), dtype=np.float64)
+            d[np.arange(d.shape[0]), np.arange(block.start, block.stop)] = 0
+            eta = 1.0 / np.where(d > 0, d, np.inf)
+            self.heuristic[block] = eta ** c.beta
+
+        # k nearest neighbours of every city, closest first
+        self.candidates = self.distances.nearest_neighbours(c.num_candidates)
+        self.refresh_weights()
+
+        self.local_search = LocalSearch(self.distances, self.candidates) if c.local_search else None
+
+    def restored(self):
+        self.refresh_weights()
+
+    def close(self):
+        # Remove the temporary directory of storage="mmap"; the colony cannot run afterwards
+        if self.scratch is not None:
+            self.pheromone = self.heuristic = self.weights = None
+            self.scratch.cleanup()
+            self.scratch = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def evaluate(self, paths):
+        self.evaluations += len(paths)
+        return self.tour_lengths(paths)
+
+    def refresh_weights(self):
+        for block in row_blocks(self.num_cities):
+            np.power(self.pheromone[block], self.config.alpha, out=self.weights[block])
+            self.weights[block] *= self.heuristic[block]
+
+    @staticmethod
+    def _roulette(choices, weights, u):
+        # Inverse-CDF draw with the uniform u in [0, 1); uniform over the
+        # choices when all weights are zero
+        total = weights.sum()
+        if total <= 0:
+            return choices[min(int(u * len(choices)), len(choices) - 1)]
+        i = np.searchsorted(np.cumsum(weights), u * total, side='right')
+        return choices[min(i, len(choices) - 1)]
+
+    def select_next_city(self, visited, current_city, u):
+        candidates = self.candidates[current_city]
+        open_candidates = candidates[~visited[candidates]]
+        if open_candidates.size:
+            return self._roulette(open_candidates, self.weights[current_city, open_candidates], u)
+
+        # Every candidate is visited: full scan over the remaining cities
+        unvisited = np.flatnonzero(~visited)
+        return self._roulette(unvisited, self.weights[current_city, unvisited], u)
+
+    def construct_solution(self, start):
+        # One tour from `start`; the uniforms for all its steps are drawn up front
+        path = np.empty(self.num_cities + 1, dtype=np.intp)
+        visited = np.zeros(self.num_cities, dtype=bool)
+        draws = self.rng.random(self.num_cities - 1)
+        current_city = start
+        path[0] = current_city
+        visited[current_city] = True
+
+        for step in range(1, self.num_cities):
+            current_city = self.select_next_city(visited, current_city, draws[step - 1])
+            path[step] = current_city
+            visited[current_city] = True
+
+        path[-1] = path[0]  # return to start
+        return path
+
+    def construct_solutions(self):
+        # All ants step together: gather an (ants x cities) slice of transition
+        # weights, zero the visited cities and draw every next city at once by
+        # inverse CDF on the row-wise cumulative sums.
+        ants = np.arange(self.config.num_ants)
+        paths = np.empty((self.config.num_ants, self.num_cities + 1), dtype=np.intp)
+        visited = np.zeros((self.config.num_ants, self.num_cities), dtype=bool)
+        current = self.rng.integers(self.num_cities, size=self.config.num_ants)
+        paths[:, 0] = current
+        visited[ants, current] = True
+
+        for step in range(1, self.num_cities):
+            weights = self.weights[current]
+            weights[visited] = 0.0
+
+            # Rows whose remaining weights are all zero choose uniformly
+            stuck = ~(weights.sum(axis=1) > 0)
+            if stuck.any():
+                weights[stuck] = ~visited[stuck]
+
+            cumulative = np.cumsum(weights, axis=1, out=weights)
+            r = self.rng.random(self.config.num_ants) * cumulative[:, -1]
+            current = np.argmax(cumulative > r[:, None], axis=1)
+            paths[:, step] = current
+            visited[ants, current] = True
+
+        paths[:, -1] = paths[:, 0]  # return to start
+        return paths
+
+    def tour_length(self, path):
+        return self.distances.tour_length(path)
+
+    def tour_lengths(self, paths):
+        return self.distances.tour_lengths(paths)
+
+    def update_pheromones(self, paths, lengths):
+        # Evaporate existing pheromone, keeping it from vanishing
+        for block in row_blocks(self.num_cities):
+            self.pheromone[block] *= (1 - self.config.rho)
+            np.maximum(self.pheromone[block], 0.0001, out=self.pheromone[block])
+
+        # Add new pheromone from every tour edge in one symmetric scatter-add
+        src = paths[:, :-1].ravel()
+        dst = paths[:, 1:].ravel()
+        contribution = np.repeat(self.config.q / np.asarray(lengths, dtype=float), paths.shape[1] - 1)
+        np.add.at(self.pheromone,
+                  (np.concatenate((src, dst)), np.concatenate((dst, src))),
+                  np.concatenate((contribution, contribution)))
+
+        self.refresh_weights()
+
+    def _step(self):
+        # One iteration: construct, (optionally) improve, measure, deposit
+        if self.config.batched:
+            paths = self.construct_solutions()
+        else:
+            starts = self.rng.integers(self.num_cities, size=self.config.num_ants)
+            paths = np.stack([self.construct_solution(start) for start in starts])
+        if self.local_search is not None:
+            paths = np.stack([self.local_search(path) for path in paths])
+        lengths = self.evaluate(paths)
+        self.paths, self.lengths = paths, lengths
+
+        self.update_best(paths, lengths)
+        self.update_pheromones(paths, lengths)
+
+    def current_population(self):
+        return self.paths, self.lengths
+
+    def diversity(self, paths):
+        # Fraction of distinct tours among this iteration's ants
+        return len(np.unique(paths, axis=0)) / len(paths)
+
+# python -m bioinspired.aco a280.tsp [iterations]
+def main():
+    from .tsplib import load_tsp
+
+    instance = load_tsp(sys.argv[1])
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    result = AntColonyOptimizer(distance_provider(instance)).run(iterations, verbose=True)
+    print("\n=== Final Best Route Found ===")
+    print(" -> ".join(map(str, result.best_position)))
+    print(f"Shortest Distance: {result.best_fitness:.4f}")
+
+if __name__ == "__main__":
+    main()
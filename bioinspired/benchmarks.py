@@ -0,0 +1,218 @@
+import argparse
+import json
+import math
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from .aco import AntColonyOptimizer
+from .cellular import CellularOptimizer
+from .cuckoo import CuckooSearch
+from .distances import distance_provider
+from .gene import GeneExpressionAlgorithm
+from .genetic import GeneticAlgorithm
+from .objectives import TEST_FUNCTIONS, Negated
+from .swarm import ParticleSwarm
+from .telemetry import MemorySink
+from .tsplib import load_tsp
+from .wolf import GreyWolfOptimizer
+
+# --- Benchmark suite ---
+# Runs every optimizer on the standard test functions (objectives.py) for
+# each dimension and population size, and the ACO on TSPLIB instances, and
+# records per case: wall time (the best of `repeats` identical runs),
+# evaluations per second, peak traced memory (one more identical run under
+# tracemalloc, so that tracing does not skew the timing), the final best
+# value and the best-so-far vs. time curve (sampled through a telemetry
+# MemorySink). The test functions are minimized; maximizing optimizers run
+# on their negation and report the value back unnegated. The gene-expression
+# GA searches the 1-D expression of `dimensions` genes, so it skips the
+# functions that need more than one dimension (Rosenbrock). The cellular
+# grid is the square nearest to the requested population, and records carry
+# its real size. Results are a list of JSON records; compare() matches them
+# against a saved baseline (same optimizer, function, dimensions,
+# population, iterations and seed) and lists the cases that got worse, or slower by more than both the relative
+# tolerance and `min_time` seconds (so millisecond cases do not flag noise).
+#
+# python -m bioinspired.benchmarks --dimensions 2 10 30 --populations 20 200 --output baseline.json
+# python -m bioinspired.benchmarks --tsp a280.tsp --baseline baseline.json
+
+OPTIMIZERS = {
+    # name: (class, config field holding the population size, config field holding the dimensions)
+    "genetic": (GeneticAlgorithm, "pop_size", "dimensions"),
+    "swarm": (ParticleSwarm, "num_particles", "dimensions"),
+    "cuckoo": (CuckooSearch, "num_nests", "dimensions"),
+    "wolf": (GreyWolfOptimizer, "num_wolves", "dimensions"),
+    "cellular": (CellularOptimizer, None, "dimensions"),  # square grid of about `population` cells
+    "gene": (GeneExpressionAlgorithm, "pop_size", "num_genes"),
+}
+
+# Optimizers whose objective sees a fixed number of dimensions, whatever the
+# case's `dimensions`
+SEARCH_DIMENSIONS = {"gene": 1}
+
+# Test functions that are only defined from this many dimensions up
+MIN_DIMENSIONS = {"rosenbrock": 2}
+
+CURVE_POINTS = 50
+
+def supported(optimizer_name, function_name, dimensions):
+    search = SEARCH_DIMENSIONS.get(optimizer_name, dimensions)
+    return search >= MIN_DIMENSIONS.get(function_name, 1)
+
+def _measure(build, iterations, memory, repeats=3):
+    wall_time = math.inf
+    for _ in range(max(1, repeats)):
+        sink = MemorySink(stride=max(1, iterations // CURVE_POINTS))
+        start = time.perf_counter()
+        optimizer = build([sink])
+        optimizer.run(iterations)
+        wall_time = min(wall_time, time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        build([]).run(iterations)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return optimizer, sink, wall_time, peak
+
+def _record(optimizer_name, function, dimensions, population, iterations, seed, optimizer, sink, wall_time,
+            peak, sign=1):
+    best = sign * optimizer.best_fitness
+    return {
+        "optimizer": optimizer_name,
+        "function": function,
+        "dimensions": dimensions,
+        "population": population,
+        "iterations": iterations,
+        "seed": seed,
+        "wall_time": wall_time,
+        "evaluations": optimizer.evaluations,
+        "evaluations_per_second": optimizer.evaluations / wall_time if wall_time > 0 else math.inf,
+        "peak_memory": peak,
+        "best": best,
+        "curve": {
+            "time": sink["time"].tolist(),
+            "best": (sign * sink["best"]).tolist(),
+        },
+    }
+
+def run_case(optimizer_name, function_name, dimensions, population, iterations=100, seed=0, memory=True,
+             repeats=3):
+    if not supported(optimizer_name, function_name, dimensions):
+        raise ValueError(f"{function_name} needs at least {MIN_DIMENSIONS[function_name]} dimensions, "
+                         f"which {optimizer_name} does not search")
+    optimizer_class, population_field, dimensions_field = OPTIMIZERS[optimizer_name]
+    function, lower, upper = TEST_FUNCTIONS[function_name]
+    sign = -1 if optimizer_class.maximize else 1
+    objective = Negated(function) if optimizer_class.maximize else function
+
+    settings = {dimensions_field: dimensions, "lower": lower, "upper": upper, "max_iter": iterations}
+    if population_field is None:
+        side = max(1, round(math.sqrt(population)))
+        settings["grid_size"] = (side, side)
+        population = side * side
+    else:
+        settings[population_field] = population
+
+    def build(observers):
+        return optimizer_class(objective=objective, rng=seed, observers=observers, **settings)
+
+    optimizer, sink, wall_time, peak = _measure(build, iterations, memory, repeats)
+    return _record(optimizer_name, function_name, dimensions, population, iterations, seed, optimizer, sink,
+                   wall_time, peak, sign)
+
+def run_tsp_case(path, num_ants=10, iterations=100, seed=0, memory=True, repeats=3, **overrides):
+    instance = load_tsp(path)
+    provider = distance_provider(instance)
+
+    def build(observers):
+        return AntColonyOptimizer(provider, num_ants=num_ants, max_iter=iterations, rng=seed, observers=observers,
+                                  **overrides)
+
+    optimizer, sink, wall_time, peak = _measure(build, iterations, memory, repeats)
+    return _record("aco", instance.name, instance.dimension, num_ants, iterations, seed, optimizer, sink,
+                   wall_time, peak)
+
+def run_suite(optimizers=tuple(OPTIMIZERS), functions=tuple(TEST_FUNCTIONS), dimensions=(2, 10, 30),
+              populations=(20, 200), iterations=100, seed=0, tsp=(), num_ants=10, memory=True, repeats=3,
+              verbose=False):
+    run_case(optimizers[0], functions[0], 2, 4, 2, seed, memory=False, repeats=1)  # warm up before timing
+    results = []
+    cases = [(o, f, d, p) for o in optimizers for f in functions for d in dimensions for p in populations
+             if supported(o, f, d)]
+    for optimizer_name, function_name, n_dims, population in cases:
+        results.append(run_case(optimizer_name, function_name, n_dims, population, iterations, seed, memory,
+                                repeats))
+        if verbose:
+            print(format_record(results[-1]))
+    for path in tsp:
+        results.append(run_tsp_case(path, num_ants, iterations, seed, memory, repeats))
+        if verbose:
+            print(format_record(results[-1]))
+    return results
+
+def _key(record):
+    return (record["optimizer"], record["function"], record["dimensions"], record["population"],
+            record["iterations"], record["seed"])
+
+def compare(results, baseline, tolerance=0.25, min_time=0.05):
+    # Cases more than `tolerance` (relative) worse than the baseline, or
+    # slower by more than `tolerance` and by more than `min_time` seconds
+    previous = {_key(record): record for record in baseline}
+    regressions = []
+    for record in results:
+        base = previous.get(_key(record))
+        if base is None:
+            continue
+        name = "/".join(map(str, _key(record)))
+        slower = record["wall_time"] - base["wall_time"]
+        if record["wall_time"] > (1 + tolerance) * base["wall_time"] and slower > min_time:
+            regressions.append(f"{name}: {record['wall_time']:.4f}s vs {base['wall_time']:.4f}s")
+        if record["best"] > base["best"] + tolerance * abs(base["best"]) + 1e-12:
+            regressions.append(f"{name}: best {record['best']:.6g} vs {base['best']:.6g}")
+    return regressions
+
+def format_record(record):
+    memory = "-" if record["peak_memory"] is None else f"{record['peak_memory'] / 2**20:.1f}MiB"
+    return (f"{record['optimizer']:>9} {record['function']:>11} d={record['dimensions']:<5} "
+            f"pop={record['population']:<6} {record['wall_time']:>8.3f}s "
+            f"{record['evaluations_per_second']:>12.0f} eval/s {memory:>9} best={record['best']:.6g}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the optimizers on standard test functions.")
+    parser.add_argument("--optimizers", nargs="+", default=list(OPTIMIZERS), choices=list(OPTIMIZERS))
+    parser.add_argument("--functions", nargs="+", default=list(TEST_FUNCTIONS), choices=list(TEST_FUNCTIONS))
+    parser.add_argument("--dimensions", nargs="+", type=int, default=[2, 10, 30])
+    parser.add_argument("--populations", nargs="+", type=int, default=[20, 200])
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tsp", nargs="*", default=[], help="TSPLIB .tsp files for the ACO")
+    parser.add_argument("--ants", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=3, help="timed runs per case (the fastest counts)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--output", help="write the results as JSON (e.g. a new baseline)")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="seconds a case must slow down by before it counts as a regression")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.optimizers, args.functions, args.dimensions, args.populations, args.iterations,
+                        args.seed, args.tsp, args.ants, not args.no_memory, args.repeats, verbose=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"python": sys.version.split()[0], "numpy": np.__version__, "results": results}, f, indent=1)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f)["results"], args.tolerance, args.min_time)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
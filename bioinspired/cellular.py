@@ -0,0 +1,216 @@
+import sys
+from dataclasses import dataclass
+from typing import Any, Tuple
+
+import numpy as np
+
+from .core import Config, Optimizer
+from .objectives import sphere
+from .telemetry import ConsoleSink
+
+# --- Cellular optimizer (Lab 6) ---
+# Cells on a rows x cols grid move toward their best neighbour. Cells are
+# stored flat: population is (num_cells, dimensions) and fitness is
+# (num_cells,). The neighbour index table (num_cells, k) is built once; with
+# fixed boundaries, neighbours that fall off the grid point back at the cell
+# itself, which can never beat it.
+#   synchronous=False -> in-place sweep, later cells see earlier updates
+#   synchronous=True  -> every cell reads the grid as it was at the start of the sweep
+# With sparse=True a sweep only visits the cells in `active`, an index array
+# of the cells that improved in the previous sweep and their neighbours (every
+# neighbourhood is symmetric, so a cell's neighbours are also the cells
+# that see it). A cell whose neighbourhood did not improve has the same best
+# neighbour as before and only a different random step, so it sleeps until
+# a neighbour improves; converged regions then cost nothing and a sweep
+# costs O(active frontier) instead of O(num_cells). Improvements of no more
+# than `wake_threshold` (1e-6 by default; set it to the scale of the
+# objective) are still accepted but wake nobody, so regions that only creep
+# toward their optimum go to sleep too. With wake_threshold=0 every
+# improvement wakes the neighbours, and on smooth objectives such as the
+# sphere the frontier then never shrinks. When no cell is active the run
+# stops with termination "converged".
+
+def neighborhood_offsets(kind="von_neumann", radius=1):
+    # Offsets (dx, dy) within distance `radius`
+    #   von_neumann -> |dx| + |dy| <= radius   (radius 1: the 4 edge neighbours)
+    #   moore       -> max(|dx|, |dy|) <= radius (radius 1: the 8 surrounding cells)
+    if kind not in ("von_neumann", "moore"):
+        raise ValueError(f"unknown neighborhood: {kind!r} (expected 'von_neumann' or 'moore')")
+    offsets = []
+    for dx in range(-radius, radius + 1):
+        for dy in range(-radius, radius + 1):
+            if (dx, dy) == (0, 0):
+                continue
+            if kind == "von_neumann" and abs(dx) + abs(dy) > radius:
+                continue
+            offsets.append((dx, dy))
+    return offsets
+
+def neighbor_table(grid_size, offsets, boundary="toroidal"):
+    if boundary not in ("toroidal", "fixed"):
+        raise ValueError(f"unknown boundary: {boundary!r} (expected 'toroidal' or 'fixed')")
+    rows, cols = grid_size
+    num_cells = rows * cols
+    i, j = np.divmod(np.arange(num_cells), cols)
+    dtype = np.int32 if num_cells < 2 ** 31 else np.int64
+    table = np.empty((num_cells, len(offsets)), dtype=dtype)
+    for k, (dx, dy) in enumerate(offsets):
+        ni, nj = i + dx, j + dy
+        if boundary == "toroidal":
+            table[:, k] = (ni % rows) * cols + nj % cols
+        else:
+            inside = (ni >= 0) & (ni < rows) & (nj >= 0) & (nj < cols)
+            table[:, k] = np.where(inside, ni * cols + nj, np.arange(num_cells))
+    return table
+
+@dataclass
+class CellularConfig(Config):
+    max_iter: int = 100
+    grid_size: Tuple[int, int] = (10, 10)
+    dimensions: int = 2
+    lower: Any = -5.12
+    upper: Any = 5.12
+    neighborhood: str = "von_neumann"
+    radius: int = 1
+    boundary: str = "toroidal"
+    synchronous: bool = False
+    sparse: bool = False
+    wake_threshold: float = 1e-6
+
+class CellularOptimizer(Optimizer):
+    config_class = CellularConfig
+    maximize = False
+    transient = Optimizer.transient + ("neighbors",)
+    phases = ("asynchronous_update", "sparse_asynchronous_update", "synchronous_update",
+              "sparse_synchronous_update", "update_cell", "evaluate")
+    default_objective = staticmethod(sphere)
+
+    def setup(self):
+        c = self.config
+        self.grid_size = tuple(c.grid_size)
+        self.num_cells = self.grid_size[0] * self.grid_size[1]
+        self.neighbors = neighbor_table(self.grid_size, neighborhood_offsets(c.neighborhood, c.radius), c.boundary)
+
+        self.population = self.rng.uniform(c.lower, c.upper, (self.num_cells, c.dimensions))
+        self.fitness = self.evaluate(self.population)
+        self.update_best(self.population, self.fitness)
+        self.active = np.arange(self.num_cells)
+
+    @property
+    def grid(self):
+        # (rows, cols, dimensions) view of the population
+        return self.population.reshape(self.grid_size + (self.config.dimensions,))
+
+    def update_cell(self, idx, step):
+        # Move cell idx by `step` (a uniform draw, made in bulk per sweep) of
+        # the way toward its best neighbour
+        current_pos = self.population[idx]
+        current_fit = self.fitness[idx]
+
+        # Get best neighbor
+        neighbors = self.neighbors[idx]
+        best = neighbors[np.argmin(self.fitness[neighbors])]
+        best_neighbor = self.population[best] if self.fitness[best] < current_fit else current_pos
+
+        # Move slightly toward the best neighbor (diffusion-like update)
+        new_pos = current_pos + step * (best_neighbor - current_pos)
+
+        # Ensure boundaries
+        new_pos = np.clip(new_pos, self.config.lower, self.config.upper)
+        new_fit = self.evaluate(new_pos[None, :])[0]
+
+        # Update if better; returns the improvement
+        if new_fit < current_fit:
+            self.population[idx] = new_pos
+            self.fitness[idx] = new_fit
+            return current_fit - new_fit
+        return 0.0
+
+    def asynchronous_update(self):
+        steps = self.rng.random(self.num_cells)
+        for idx in range(self.num_cells):
+            self.update_cell(idx, steps[idx])
+
+    def wake(self, woken):
+        # The next frontier: the woken cells and their neighbours
+        self.active = np.unique(np.concatenate((woken, self.neighbors[woken].ravel())))
+
+    def sparse_asynchronous_update(self):
+        cells = self.active
+        steps = self.rng.random(len(cells))
+        woken = []
+        for idx, step in zip(cells, steps):
+            if self.update_cell(idx, step) > self.config.wake_threshold:
+                woken.append(idx)
+        self.wake(np.array(woken, dtype=cells.dtype))
+        return cells
+
+    def synchronous_update(self, cells=None):
+        # Best neighbour of every cell (or of `cells`) from the index table,
+        # then one batched diffusion move and objective call; improvements
+        # accepted by mask. Returns the improvement of each cell (0 if none)
+        cells = np.arange(self.num_cells) if cells is None else cells
+        neighbors = self.neighbors[cells]
+        neighbor_fit = self.fitness[neighbors]
+        k = np.argmin(neighbor_fit, axis=1)
+        rows = np.arange(len(cells))
+        best = neighbors[rows, k]
+        current = self.population[cells]
+        best_neighbor = np.where((neighbor_fit[rows, k] < self.fitness[cells])[:, None],
+                                 self.population[best], current)
+
+        step = self.rng.random((len(cells), 1))
+        new_pos = np.clip(current + step * (best_neighbor - current), self.config.lower, self.config.upper)
+        new_fit = self.evaluate(new_pos)
+
+        gain = np.maximum(self.fitness[cells] - new_fit, 0)
+        improved = gain > 0
+        self.population[cells[improved]] = new_pos[improved]
+        self.fitness[cells[improved]] = new_fit[improved]
+        return gain
+
+    def sparse_synchronous_update(self):
+        cells = self.active
+        self.wake(cells[self.synchronous_update(cells) > self.config.wake_threshold])
+        return cells
+
+    def _step(self):
+        if self.config.sparse and not len(self.active):
+            return
+        if self.config.sparse:
+            # Only the visited cells can have changed; the sweeps return them
+            update = self.sparse_synchronous_update if self.config.synchronous else self.sparse_asynchronous_update
+            cells = update()
+            self.update_best(self.population[cells], self.fitness[cells])
+            return
+        if self.config.synchronous:
+            self.synchronous_update()
+        else:
+            self.asynchronous_update()
+        self.update_best(self.population, self.fitness)
+
+    @property
+    def frontier(self):
+        # Number of cells the next sparse sweep will visit
+        return len(self.active) if self.config.sparse else self.num_cells
+
+    def check_termination(self):
+        if self.config.sparse and not len(self.active):
+            return "converged"
+        return super().check_termination()
+
+# python -m bioinspired.cellular         -> asynchronous in-place sweep
+# python -m bioinspired.cellular --sync  -> whole-grid synchronous update
+# add --sparse to sweep only the cells whose neighbourhood improved
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    optimizer = CellularOptimizer(synchronous="--sync" in argv, sparse="--sparse" in argv,
+                                  observers=[ConsoleSink(stride=10)])
+    result = optimizer.run()
+    print("\n=== Final Result ===")
+    print("Best Solution:", result.best_position)
+    print("Best Fitness:", result.best_fitness)
+    print("Stopped by:", result.termination)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import dataclasses
+import json
+import os
+import shutil
+
+import numpy as np
+
+# --- Checkpoint and resume ---
+# A checkpoint is a directory: one .npy file per array attribute of the
+# optimizer (population, fitness, pheromone, ...; memory-mapped arrays
+# stream straight to disk), the history as history.npy, and state.json with
+# the config, the scalar attributes (iteration, evaluations, best_fitness,
+# ...) and the bit generator state. Nothing is pickled. Attributes an
+# optimizer lists in `transient` (rebuilt by setup(), like the ACO heuristic and candidate
+# lists) and anything that is not an array, a number or a string (the
+# objective, evaluator, observers, distance provider) are left out.
+#
+# save_checkpoint() writes to <path>.tmp, fsyncs every file and the
+# directory, and then swaps it in with renames (fsyncing the parent
+# directory around them), so a crash leaves either the previous or the new
+# checkpoint whole (the previous one as <path>.old during the swap;
+# load_checkpoint() falls back to it). load_checkpoint() restores into an
+# optimizer constructed the same way as the saved one (same class, config,
+# objective and distances), copying arrays in place so memory-mapped storage
+# stays where it is, and the run
+# then continues bit for bit: run() goes on until config.max_iter. It raises
+# ValueError when the class or a config field differs from the checkpoint,
+# except for the fields the optimizer lists in `resume_overrides` (max_iter
+# and the termination criteria, so a resumed run can be given a longer
+# budget). Scalars are only restored over attributes that hold a scalar or
+# an array, so state setup() builds from the config (the ACO's local_search
+# stage) is kept.
+
+STATE_FILE = "state.json"
+
+def _scalar(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return NotImplemented
+
+def _config_state(config):
+    # The config as JSON values (tuples and arrays become lists)
+    return json.loads(json.dumps(dataclasses.asdict(config),
+                                 default=lambda value: value.tolist() if hasattr(value, "tolist") else str(value)))
+
+def _save_array(path, value):
+    with open(path, "wb") as f:
+        np.save(f, value)
+        f.flush()
+        os.fsync(f.fileno())
+
+def _fsync_directory(path):
+    # Makes created and renamed entries durable; Windows cannot open directories
+    if os.name == "nt":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def save_checkpoint(optimizer, path):
+    tmp = f"{path}.tmp"
+    old = f"{path}.old"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+
+    skip = set(optimizer.transient)
+    scalars, arrays = {}, []
+    for name, value in vars(optimizer).items():
+        if name in skip:
+            continue
+        if isinstance(value, np.ndarray):
+            _save_array(os.path.join(tmp, f"{name}.npy"), value)
+            arrays.append(name)
+        elif _scalar(value) is not NotImplemented:
+            scalars[name] = _scalar(value)
+    _save_array(os.path.join(tmp, "history.npy"), np.asarray(optimizer.history, dtype=float))
+
+    state = {
+        "class": type(optimizer).__name__,
+        "config": _config_state(optimizer.config),
+        "scalars": scalars,
+        "arrays": arrays,
+        "rng": optimizer.rng.bit_generator.state,
+    }
+    with open(os.path.join(tmp, STATE_FILE), "w") as f:
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+    _fsync_directory(tmp)
+
+    parent = os.path.dirname(os.path.abspath(path))
+    _fsync_directory(parent)
+    if os.path.exists(path):
+        shutil.rmtree(old, ignore_errors=True)
+        os.rename(path, old)
+    os.rename(tmp, path)
+    _fsync_directory(parent)
+    shutil.rmtree(old, ignore_errors=True)
+
+def load_checkpoint(optimizer, path):
+    if not os.path.exists(os.path.join(path, STATE_FILE)) and os.path.exists(f"{path}.old"):
+        path = f"{path}.old"
+    with open(os.path.join(path, STATE_FILE)) as f:
+        state = json.load(f)
+    if state["class"] != type(optimizer).__name__:
+        raise ValueError(f"checkpoint is for {state['class']}, not {type(optimizer).__name__}")
+    config = _config_state(optimizer.config)
+    differing = sorted(name for name in set(config) | set(state["config"])
+                       if name not in optimizer.resume_overrides
+                       and config.get(name) != state["config"].get(name))
+    if differing:
+        raise ValueError("checkpoint config differs in " + ", ".join(
+            f"{name} (saved {state['config'].get(name)!r}, now {config.get(name)!r})" for name in differing))
+
+    for name, value in state["scalars"].items():
+        current = getattr(optimizer, name, None)
+        if isinstance(current, np.ndarray) or _scalar(current) is not NotImplemented:
+            setattr(optimizer, name, value)
+    for name in state["arrays"]:
+        saved = np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+        current = getattr(optimizer, name, None)
+        if isinstance(current, np.ndarray) and current.shape == saved.shape and current.dtype == saved.dtype:
+            current[...] = saved
+        else:
+            setattr(optimizer, name, np.array(saved))
+    optimizer.history = np.load(os.path.join(path, "history.npy")).tolist()
+    optimizer.rng.bit_generator.state = state["rng"]
+    optimizer.restored()
+    return optimizer
@@ -0,0 +1,228 @@
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, List, Optional
+
+import numpy as np
+
+from .evaluators import SerialEvaluator
+from .objectives import batch_objective, check_fitness
+
+# --- Shared optimizer interface ---
+# Every optimizer is built from a config dataclass (keyword overrides are
+# applied on top of it), holds all of its state on the instance, advances
+# one iteration per step() and returns a Result from run(). Fitness is
+# computed through a pluggable evaluator (serial by default; see evaluators.py).
+#
+# Randomness: `rng` is a seed, a SeedSequence or a Generator, and every draw
+# an optimizer makes comes from self.rng in bulk. Parallel work (islands,
+# replicas, workers) takes child streams from seed_sequence(rng).spawn(n), so
+# the streams are independent and reproducible from the one root seed.
+#
+# Telemetry: `observers` (see telemetry.py) are sampled after step() at
+# their own stride with the row from metrics().
+#
+# Checkpoints: run(checkpoint=path, checkpoint_every=k) saves the state every
+# k iterations and at the end (see checkpoint.py); a run resumed with
+# load_checkpoint() continues until config.max_iter.
+#
+# Termination: besides max_iter, run() stops after the first iteration that
+# meets any enabled criterion of the config and records which one in
+# Result.termination:
+#   "target"       best fitness reached `target` (>= when maximizing)
+#   "stagnation"   best fitness moved by no more than `tolerance` over the
+#                  last `stagnation` iterations
+#   "diversity"    population diversity (see diversity()) fell below
+#                  `min_diversity`
+#   "time"         `max_time` seconds since the optimizer was built
+#   "evaluations"  `max_evaluations` fitness evaluations spent
+# and "max_iter" when the iteration budget ran out first.
+
+@dataclass
+class Config:
+    max_iter: int = 50
+    target: Optional[float] = None
+    stagnation: Optional[int] = None
+    tolerance: float = 0.0
+    min_diversity: Optional[float] = None
+    max_time: Optional[float] = None
+    max_evaluations: Optional[int] = None
+
+@dataclass
+class BoxConfig(Config):
+    # Search space for the continuous optimizers; lower/upper may be scalars
+    # (broadcast to `dimensions`) or per-dimension sequences
+    lower: Any = 0.0
+    upper: Any = 1.0
+    dimensions: int = 1
+
+@dataclass
+class Result:
+    best_position: Any
+    best_fitness: float
+    iterations: int
+    evaluations: int
+    maximize: bool
+    history: List[float] = field(default_factory=list)  # best fitness after each iteration
+    termination: str = "max_iter"
+
+def seed_sequence(rng):
+    # Root SeedSequence of a seed, SeedSequence or Generator
+    if isinstance(rng, np.random.SeedSequence):
+        return rng
+    if isinstance(rng, np.random.Generator):
+        return rng.bit_generator.seed_seq
+    return np.random.SeedSequence(rng)
+
+def spawn_generators(rng, n):
+    return [np.random.default_rng(child) for child in seed_sequence(rng).spawn(n)]
+
+def box_bounds(config):
+    lower = np.atleast_1d(np.asarray(config.lower, dtype=float))
+    upper = np.atleast_1d(np.asarray(config.upper, dtype=float))
+    n_dims = max(lower.size, upper.size, config.dimensions)
+    return np.broadcast_to(lower, (n_dims,)).copy(), np.broadcast_to(upper, (n_dims,)).copy()
+
+class Optimizer:
+    config_class = Config
+    maximize = True
+    transient = ("start_time",)  # attributes a checkpoint leaves out
+    # Config fields a resumed run may set differently from the checkpoint
+    # (the budget and termination criteria; see checkpoint.py)
+    resume_overrides = ("max_iter", "target", "stagnation", "tolerance", "min_diversity", "max_time",
+                        "max_evaluations")
+    phases = ("evaluate",)  # methods profiling.profile() times
+
+    def __init__(self, config=None, *, objective=None, evaluator=None, rng=None, observers=None, **overrides):
+        if config is None:
+            config = self.config_class(**overrides)
+        elif overrides:
+            config = replace(config, **overrides)
+        self.config = config
+        self.objective = batch_objective(objective if objective is not None else self.default_objective)
+        self.evaluator = evaluator if evaluator is not None else SerialEvaluator()
+        self.rng = np.random.default_rng(rng)
+        self.observers = list(observers or ())
+        self.start_time = time.perf_counter()
+
+        self.iteration = 0
+        self.evaluations = 0
+        self.history = []
+        self.best_position = None
+        self.best_fitness = -np.inf if self.maximize else np.inf
+        self.termination = None
+        self.setup()
+
+    @staticmethod
+    def default_objective(x):
+        raise NotImplementedError
+
+    def setup(self):
+        # Create the initial population and evaluate it
+        raise NotImplementedError
+
+    def _step(self):
+        raise NotImplementedError
+
+    def restored(self):
+        # Rebuild derived state after load_checkpoint()
+        pass
+
+    def evaluate(self, x):
+        # Rows of x are candidates, one fitness per row (scalar objectives
+        # were lifted to this protocol in __init__; see objectives.py)
+        self.evaluations += len(x)
+        return check_fitness(self.evaluator(self.objective, x, self.worst_fitness), len(x))
+
+    @property
+    def worst_fitness(self):
+        return -np.inf if self.maximize else np.inf
+
+    def is_better(self, a, b):
+        return a > b if self.maximize else a < b
+
+    def update_best(self, positions, fitness):
+        i = np.argmax(fitness) if self.maximize else np.argmin(fitness)
+        if self.is_better(fitness[i], self.best_fitness):
+            self.best_fitness = float(fitness[i])
+            self.best_position = np.array(positions[i], copy=True)
+
+    def current_population(self):
+        # Positions and fitness the population holds right now
+        return self.population, self.fitness
+
+    def diversity(self, positions):
+        # Mean per-dimension standard deviation of the population
+        return float(np.mean(np.std(positions, axis=0)))
+
+    def metrics(self):
+        # One telemetry row, in the order of telemetry.FIELDS
+        positions, fitness = self.current_population()
+        return (self.iteration, self.best_fitness, float(np.mean(fitness)), self.diversity(positions),
+                self.evaluations, time.perf_counter() - self.start_time)
+
+    def notify(self):
+        row = None
+        for observer in self.observers:
+            if self.iteration % observer.stride == 0:
+                row = self.metrics() if row is None else row
+                observer.record(row)
+
+    def spawn(self, n):
+        # Independent child generators, e.g. one per worker of a parallel objective
+        return spawn_generators(self.rng, n)
+
+    def emigrants(self, count):
+        # Island-model exchange (islands.py) for optimizers with a
+        # population/fitness pair: the best `count` individuals leave, and
+        # immigrants replace the worst ones with their known fitness
+        order = np.argsort(-self.fitness if self.maximize else self.fitness)[:count]
+        return self.population[order].copy(), self.fitness[order].copy()
+
+    def immigrate(self, positions, fitness):
+        order = np.argsort(self.fitness if self.maximize else -self.fitness)[:len(fitness)]
+        self.population[order] = positions
+        self.fitness[order] = fitness
+        self.update_best(positions, fitness)
+
+    def step(self):
+        self._step()
+        self.iteration += 1
+        self.history.append(self.best_fitness)
+        self.notify()
+
+    def check_termination(self):
+        # Name of the first criterion met, or None to keep going
+        c = self.config
+        if c.target is not None and not self.is_better(c.target, self.best_fitness):
+            return "target"
+        if c.stagnation is not None and len(self.history) > c.stagnation:
+            if abs(self.history[-1] - self.history[-1 - c.stagnation]) <= c.tolerance:
+                return "stagnation"
+        if c.min_diversity is not None and self.diversity(self.current_population()[0]) < c.min_diversity:
+            return "diversity"
+        if c.max_time is not None and time.perf_counter() - self.start_time >= c.max_time:
+            return "time"
+        if c.max_evaluations is not None and self.evaluations >= c.max_evaluations:
+            return "evaluations"
+        return None
+
+    def run(self, iterations=None, verbose=False, checkpoint=None, checkpoint_every=10):
+        iterations = self.config.max_iter - self.iteration if iterations is None else iterations
+        for i in range(iterations):
+            self.step()
+            if verbose:
+                print(f"Iteration {self.iteration}: Best Fitness = {self.best_fitness:.5f}")
+            self.termination = self.check_termination()
+            last = self.termination is not None or i == iterations - 1
+            if checkpoint is not None and (self.iteration % checkpoint_every == 0 or last):
+                from .checkpoint import save_checkpoint
+                save_checkpoint(self, checkpoint)
+            if self.termination is not None:
+                break
+        for observer in self.observers:
+            observer.flush()
+        return self.result()
+
+    def result(self):
+        return Result(self.best_position, self.best_fitness, self.iteration, self.evaluations,
+                      self.maximize, list(self.history), self.termination or "max_iter")
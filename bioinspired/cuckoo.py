@@ -0,0 +1,82 @@
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from .core import BoxConfig, Optimizer, box_bounds
+from .objectives import sine_wave
+
+# --- Cuckoo search (Labs 3 and 4) ---
+# All nests are one (num_nests, dimensions) array. sigma is cached per
+# Lambda, the Lévy steps for the whole population are drawn in one call,
+# greedy replacement uses a boolean mask and abandoned nests are rewritten
+# with a single fancy-indexed assignment.
+
+@lru_cache(maxsize=None)
+def mantegna_sigma(Lambda):
+    return (math.gamma(1 + Lambda) * math.sin(math.pi * Lambda / 2) /
+            (math.gamma((1 + Lambda) / 2) * Lambda * 2 ** ((Lambda - 1) / 2))) ** (1 / Lambda)
+
+def levy_flights(rng, shape, Lambda=1.5):
+    u = rng.standard_normal(shape) * mantegna_sigma(Lambda)
+    v = rng.standard_normal(shape)
+    return u / np.abs(v) ** (1 / Lambda)
+
+@dataclass
+class CuckooConfig(BoxConfig):
+    num_nests: int = 20
+    pa: float = 0.25         # probability of discovery (abandon fraction)
+    Lambda: float = 1.5      # Lévy exponent
+
+class CuckooSearch(Optimizer):
+    config_class = CuckooConfig
+    default_objective = staticmethod(sine_wave)
+    phases = ("get_cuckoos", "evaluate", "abandon_nests")
+
+    def setup(self):
+        self.lower, self.upper = box_bounds(self.config)
+        self.shape = (self.config.num_nests, self.lower.size)
+        self.num_abandon = int(self.config.pa * self.config.num_nests)
+
+        self.nests = self.rng.uniform(self.lower, self.upper, self.shape)
+        self.fitness = self.evaluate(self.nests)
+        self.update_best(self.nests, self.fitness)
+
+    def get_cuckoos(self):
+        step_size = levy_flights(self.rng, self.shape, self.config.Lambda) * self.rng.uniform(-1, 1, self.shape)
+        new_nests = self.best_position + step_size * self.rng.uniform(-1, 1, self.shape)
+        return np.clip(new_nests, self.lower, self.upper, out=new_nests)
+
+    def abandon_nests(self):
+        # Replace the worst fraction with new random positions; only those are re-evaluated
+        if self.num_abandon == 0:
+            return
+        key = self.fitness if self.maximize else -self.fitness
+        worst = np.argpartition(key, self.num_abandon - 1)[:self.num_abandon]
+        self.nests[worst] = self.rng.uniform(self.lower, self.upper, (self.num_abandon, self.shape[1]))
+        self.fitness[worst] = self.evaluate(self.nests[worst])
+
+    def _step(self):
+        new_nests = self.get_cuckoos()
+        new_fitness = self.evaluate(new_nests)
+
+        # If the new solution is better, replace it
+        better = self.is_better(new_fitness, self.fitness)
+        self.nests[better] = new_nests[better]
+        self.fitness[better] = new_fitness[better]
+
+        self.abandon_nests()
+        self.update_best(self.nests, self.fitness)
+
+    def current_population(self):
+        return self.nests, self.fitness
+
+def main():
+    result = CuckooSearch().run(verbose=True)
+    print("\n=== Final Result ===")
+    print(f"Best solution x = {np.array2string(result.best_position, precision=5)}")
+    print(f"Best fitness = {result.best_fitness:.5f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+import os
+import tempfile
+
+import numpy as np
+
+# --- Distance providers ---
+# Every provider exposes num_cities, d(i, j), row(i), rows(idx), pairs(a, b)
+# and tour_length(path), so the ACO code never cares where distances live:
+#   DenseDistance      float32 (n, n) matrix in RAM
+#   MemmapDistance     float32 (n, n) matrix in a file on disk (np.memmap)
+#   EuclideanDistance  computed on the fly from the (n, 2) coordinate array
+# A memory-mapped provider built without a path keeps its file in a
+# temporary directory that is removed by close() or when the provider is
+# garbage-collected.
+# Large matrices are filled and scanned in blocks of BLOCK_ROWS rows so no
+# temporary ever holds more than BLOCK_ROWS * n values.
+
+BLOCK_ROWS = 1024
+
+def row_blocks(n, block_rows=BLOCK_ROWS):
+    for start in range(0, n, block_rows):
+        yield slice(start, min(start + block_rows, n))
+
+METRICS = (None, "EUC_2D", "CEIL_2D", "ATT", "GEO")
+
+def metric(xa, ya, xb, yb, kind=None):
+    # Elementwise (broadcasting) distance for the TSPLIB EDGE_WEIGHT_TYPEs;
+    # kind=None is the plain floating-point Euclidean distance.
+    if kind not in METRICS:
+        raise ValueError(f"unsupported EDGE_WEIGHT_TYPE: {kind}")
+    if kind == "GEO":
+        lat_a, lon_a = _geo_radians(xa), _geo_radians(ya)
+        lat_b, lon_b = _geo_radians(xb), _geo_radians(yb)
+        q1 = np.cos(lon_a - lon_b)
+        q2 = np.cos(lat_a - lat_b)
+        q3 = np.cos(lat_a + lat_b)
+        cos_angle = np.clip(0.5 * ((1 + q1) * q2 - (1 - q1) * q3), -1, 1)
+        return np.floor(6378.388 * np.arccos(cos_angle) + 1)
+
+    dx = xa - xb
+    dy = ya - yb
+    squared = dx * dx + dy * dy
+    if kind == "ATT":
+        r = np.sqrt(squared / 10)
+        t = np.floor(r + 0.5)
+        return np.where(t < r, t + 1, t)
+    d = np.sqrt(squared)
+    if kind == "EUC_2D":
+        return np.floor(d + 0.5)
+    if kind == "CEIL_2D":
+        return np.ceil(d)
+    return d
+
+def _geo_radians(x):
+    degrees = np.trunc(x)
+    return 3.141592 * (degrees + 5.0 * (x - degrees) / 3.0) / 180.0
+
+def new_matrix(n, fill=0.0, storage="dense", directory=None, name="matrix", dtype=np.float32):
+    # (n, n) work matrix for pheromone and friends, in RAM or memory-mapped
+    if storage == "dense":
+        return np.full((n, n), fill, dtype=dtype)
+    if storage == "mmap":
+        if directory is None:
+            raise ValueError("storage='mmap' needs a directory for the matrix files")
+        matrix = np.memmap(os.path.join(directory, f"{name}.dat"), dtype=dtype, mode="w+", shape=(n, n))
+        for block in row_blocks(n):
+            matrix[block] = fill
+        return matrix
+    raise ValueError(f"unknown storage: {storage!r} (expected 'dense' or 'mmap')")
+
+class DistanceProvider:
+    num_cities = 0
+
+    def rows(self, idx):
+        raise NotImplementedError
+
+    def pairs(self, a, b):
+        raise NotImplementedError
+
+    def d(self, i, j):
+        return float(self.pairs(i, j))
+
+    def row(self, i):
+        return self.rows(np.array([i]))[0]
+
+    def tour_length(self, path):
+        path = np.asarray(path)
+        return float(self.pairs(path[:-1], path[1:]).sum(dtype=np.float64))
+
+    def tour_lengths(self, paths):
+        return self.pairs(paths[:, :-1], paths[:, 1:]).sum(axis=1, dtype=np.float64)
+
+    def close(self):
+        pass
+
+    def nearest_neighbours(self, k):
+        # k closest cities of every city (closest first), computed block-wise
+        n = self.num_cities
+        k = min(k, n - 1)
+        result = np.empty((n, k), dtype=np.intp)
+        if k <= 0:
+            return result
+        for block in row_blocks(n):
+            d = np.array(self.rows(np.arange(block.start, block.stop)), dtype=np.float64)
+            d[np.arange(d.shape[0]), np.arange(block.start, block.stop)] = np.inf
+            nearest = np.argpartition(d, k - 1, axis=1)[:, :k]
+            order = np.argsort(np.take_along_axis(d, nearest, axis=1), axis=1)
+            result[block] = np.take_along_axis(nearest, order, axis=1)
+        return result
+
+class DenseDistance(DistanceProvider):
+    def __init__(self, matrix):
+        self.matrix = matrix
+        self.num_cities = matrix.shape[0]
+
+    @staticmethod
+    def _fill(matrix, coords, kind):
+        x, y = coords[:, 0], coords[:, 1]
+        for block in row_blocks(len(coords)):
+            matrix[block] = metric(x[block, None], y[block, None], x[None, :], y[None, :], kind)
+
+    @classmethod
+    def from_coords(cls, coords, kind=None, dtype=np.float32):
+        coords = np.asarray(coords, dtype=np.float64)
+        matrix = np.empty((len(coords), len(coords)), dtype=dtype)
+        cls._fill(matrix, coords, kind)
+        return cls(matrix)
+
+    def d(self, i, j):
+        return float(self.matrix[i, j])
+
+    def row(self, i):
+        return self.matrix[i]
+
+    def rows(self, idx):
+        return self.matrix[idx]
+
+    def pairs(self, a, b):
+        return self.matrix[a, b]
+
+class MemmapDistance(DenseDistance):
+    # Same access pattern as DenseDistance; the OS pages rows in on demand
+    scratch = None  # tempfile.TemporaryDirectory holding the file, if we made one
+
+    @classmethod
+    def build(cls, coords, path, kind=None, dtype=np.float32):
+        coords = np.asarray(coords, dtype=np.float64)
+        n = len(coords)
+        matrix = np.memmap(path, dtype=dtype, mode="w+", shape=(n, n))
+        cls._fill(matrix, coords, kind)
+        matrix.flush()
+        return cls.open(path, n, dtype)
+
+    @classmethod
+    def from_matrix(cls, matrix, path):
+        mapped = np.memmap(path, dtype=matrix.dtype, mode="w+", shape=matrix.shape)
+        for block in row_blocks(matrix.shape[0]):
+            mapped[block] = matrix[block]
+        mapped.flush()
+        return cls.open(path, matrix.shape[0], matrix.dtype)
+
+    @classmethod
+    def open(cls, path, n, dtype=np.float32):
+        return cls(np.memmap(path, dtype=dtype, mode="r", shape=(n, n)))
+
+    def close(self):
+        if self.scratch is not None:
+            self.matrix = None
+            self.scratch.cleanup()
+            self.scratch = None
+
+class EuclideanDistance(DistanceProvider):
+    # O(n) memory: nothing but the coordinates is stored
+    def __init__(self, coords, kind=None):
+        if kind not in METRICS:
+            raise ValueError(f"unsupported EDGE_WEIGHT_TYPE: {kind}")
+        self.coords = np.asarray(coords, dtype=np.float64)
+        self.kind = kind
+        self.num_cities = len(self.coords)
+
+    def rows(self, idx):
+        x, y = self.coords[:, 0], self.coords[:, 1]
+        idx = np.asarray(idx)
+        return metric(x[idx, None], y[idx, None], x[None, :], y[None, :], self.kind)
+
+    def pairs(self, a, b):
+        x, y = self.coords[:, 0], self.coords[:, 1]
+        return metric(x[a], y[a], x[b], y[b], self.kind)
+
+def distance_provider(instance, backend="dense", path=None):
+    # Build a provider for a tsplib.TSPInstance
+    kind = None if instance.edge_weight_type == "EXPLICIT" else instance.edge_weight_type
+    if backend == "mmap":
+        scratch = None
+        if path is None:
+            scratch = tempfile.TemporaryDirectory(prefix="aco-")
+            path = os.path.join(scratch.name, "dist.dat")
+        if instance.matrix is not None:
+            provider = MemmapDistance.from_matrix(instance.matrix, path)
+        else:
+            provider = MemmapDistance.build(instance.coords, path, kind)
+        provider.scratch = scratch
+        return provider
+
+    if instance.matrix is not None:
+        if backend == "dense":
+            return DenseDistance(instance.matrix)
+        raise ValueError("EXPLICIT instances have no coordinates for on-the-fly distances")
+
+    if backend == "dense":
+        return DenseDistance.from_coords(instance.coords, kind)
+    if backend == "euclidean":
+        return EuclideanDistance(instance.coords, kind)
+    raise ValueError(f"unknown distance backend: {backend!r}")
@@ -0,0 +1,299 @@
+import hashlib
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import numpy as np
+
+# --- Fitness evaluators ---
+# An evaluator is called as evaluator(objective, x, worst) and returns one
+# fitness per row of x. Optimizers take one through `evaluator=`:
+#   SerialEvaluator       objective(x) in the calling thread (the default)
+#   ThreadPoolEvaluator   chunks of rows on a thread pool; suits objectives
+#                         that release the GIL (NumPy, I/O, subprocesses)
+#   ProcessPoolEvaluator  chunks of rows on a process pool; x is copied once
+#                         per call into a shared-memory block that the
+#                         workers read, so the population is never pickled
+# The pool evaluators split x into chunks of chunk_size rows (default: about
+# four chunks per worker) to amortize dispatch cost. With `timeout` set, the
+# default chunk size is 1 and every chunk has a deadline counted from the
+# moment the call submitted it: timeout * rows seconds for each wave of
+# `workers` chunks up to and including its own (the k-th chunk runs in wave
+# k // workers), so a chunk's limit does not depend on how long the parent
+# happened to wait for earlier ones. Rows of a chunk that misses its deadline
+# are given the `worst` fitness; with an explicit chunk_size > 1 one slow row
+# costs its whole chunk. Timed-out threads cannot be interrupted and keep
+# running in the background; the process pool is restarted instead, which
+# kills the stuck workers. Objectives sent to a process pool must be
+# picklable (module-level functions, not lambdas).
+#
+# submit(objective, x) evaluates a few rows on their own and returns a
+# concurrent.futures.Future at once; the asynchronous steady-state mode
+# (steady_state.py) keeps several of these in flight.
+#
+# CachingEvaluator wraps any of them with an LRU memo of fitness by genotype:
+# rows are keyed on a 16-byte BLAKE2 digest of their bytes (after rounding to
+# a multiple of `quantum`, when given), and only rows missing from the cache,
+# each distinct one once, reach the wrapped evaluator. The cache holds at
+# most max_bytes // CACHE_ENTRY_BYTES entries; hits/misses count rows served
+# from the cache and rows actually evaluated. Use one cache per objective.
+
+def chunk_bounds(n, chunk_size):
+    return [(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+
+class SerialEvaluator:
+    def __call__(self, objective, x, worst=np.nan):
+        return np.asarray(objective(x), dtype=float)
+
+    def submit(self, objective, x):
+        # Nothing runs in the background: the future is already resolved
+        future = Future()
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(self(objective, x))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# Measured footprint of one LRU entry: digest key, float value, dict slot
+# and order link
+CACHE_ENTRY_BYTES = 180
+
+class CachingEvaluator(SerialEvaluator):
+    def __init__(self, evaluator=None, max_bytes=64 * 2**20, quantum=None):
+        self.evaluator = evaluator if evaluator is not None else SerialEvaluator()
+        self.max_entries = max(1, max_bytes // CACHE_ENTRY_BYTES)
+        self.quantum = quantum
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def workers(self):
+        return getattr(self.evaluator, "workers", 1)
+
+    @property
+    def timeout(self):
+        return getattr(self.evaluator, "timeout", None)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def keys(self, x):
+        x = np.asarray(x, dtype=float)
+        if self.quantum is not None:
+            x = np.round(x / self.quantum).astype(np.int64)
+        x = np.ascontiguousarray(x.reshape(len(x), -1))
+        return [hashlib.blake2b(row, digest_size=16).digest() for row in x]
+
+    def _lookup(self, keys, fitness):
+        # Fills the cached rows of fitness; returns {key: [rows]} for the rest
+        missing = {}
+        with self.lock:
+            for i, key in enumerate(keys):
+                value = self.cache.get(key)
+                if value is None:
+                    missing.setdefault(key, []).append(i)
+                else:
+                    self.cache.move_to_end(key)
+                    fitness[i] = value
+            self.misses += len(missing)
+            self.hits += len(keys) - len(missing)
+        return missing
+
+    def _store(self, key, value, worst=np.nan):
+        # Timed-out and failed evaluations are not remembered
+        if np.isnan(value) or value == worst:
+            return
+        with self.lock:
+            self.cache[key] = value
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.max_entries:
+                self.cache.popitem(last=False)
+
+    def __call__(self, objective, x, worst=np.nan):
+        fitness = np.empty(len(x))
+        missing = self._lookup(self.keys(x), fitness)
+        if missing:
+            first_rows = [rows[0] for rows in missing.values()]
+            values = self.evaluator(objective, np.asarray(x)[first_rows], worst)
+            for (key, rows), value in zip(missing.items(), values):
+                fitness[rows] = value
+                self._store(key, float(value), worst)
+        return fitness
+
+    def submit(self, objective, x):
+        fitness = np.empty(len(x))
+        keys = self.keys(x)
+        if not self._lookup(keys, fitness):
+            future = Future()
+            future.set_running_or_notify_cancel()
+            future.set_result(fitness)
+            return future
+
+        def remember(future):
+            if future.exception() is None:
+                for key, value in zip(keys, future.result()):
+                    self._store(key, float(value))
+
+        future = self.evaluator.submit(objective, x)
+        future.add_done_callback(remember)
+        return future
+
+    def clear(self):
+        with self.lock:
+            self.cache.clear()
+
+    def close(self):
+        self.evaluator.close()
+
+class _PoolEvaluator(SerialEvaluator):
+    def __init__(self, workers=None, chunk_size=None, timeout=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+
+    def _chunk_size(self, n):
+        if self.chunk_size:
+            return self.chunk_size
+        if self.timeout is not None:
+            return 1  # a slow row only fails itself
+        return max(1, math.ceil(n / (4 * self.workers)))
+
+    def __call__(self, objective, x, worst=np.nan):
+        from concurrent.futures import TimeoutError as FutureTimeout
+        from multiprocessing import TimeoutError as PoolTimeout
+
+        x = np.ascontiguousarray(x)
+        fitness = np.empty(len(x))
+        bounds = chunk_bounds(len(x), self._chunk_size(len(x)))
+        submitted = time.perf_counter()
+        pending = self._submit(objective, x, bounds)
+
+        timed_out = False
+        for k, ((start, stop), handle) in enumerate(zip(bounds, pending)):
+            timeout = None
+            if self.timeout is not None:
+                deadline = submitted + self.timeout * (stop - start) * (k // self.workers + 1)
+                timeout = max(0.0, deadline - time.perf_counter())
+            try:
+                fitness[start:stop] = self._result(handle, timeout)
+            except (TimeoutError, FutureTimeout, PoolTimeout):
+                fitness[start:stop] = worst
+                timed_out = True
+        if timed_out:
+            self._on_timeout()
+        return fitness
+
+    def _on_timeout(self):
+        pass
+
+def _evaluate_rows(objective, x, start, stop):
+    return np.asarray(objective(x[start:stop]), dtype=float)
+
+class ThreadPoolEvaluator(_PoolEvaluator):
+    def __init__(self, workers=None, chunk_size=None, timeout=None):
+        from concurrent.futures import ThreadPoolExecutor
+
+        super().__init__(workers, chunk_size, timeout)
+        self.executor = ThreadPoolExecutor(self.workers)
+
+    def _submit(self, objective, x, bounds):
+        return [self.executor.submit(_evaluate_rows, objective, x, start, stop) for start, stop in bounds]
+
+    def _result(self, future, timeout):
+        return future.result(timeout)
+
+    def submit(self, objective, x):
+        return self.executor.submit(_evaluate_rows, objective, x, 0, len(x))
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+# Worker side of the process pool: shared-memory blocks stay attached
+# between calls, keyed by name
+_attached = {}
+
+def _evaluate_shared(objective, name, shape, dtype, start, stop):
+    from multiprocessing import shared_memory
+
+    shm = _attached.get(name)
+    if shm is None:
+        for old in _attached.values():
+            old.close()
+        _attached.clear()
+        shm = _attached[name] = shared_memory.SharedMemory(name=name)
+    x = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    return np.asarray(objective(x[start:stop]), dtype=float)
+
+class ProcessPoolEvaluator(_PoolEvaluator):
+    def __init__(self, workers=None, chunk_size=None, timeout=None, context=None):
+        import multiprocessing
+        from multiprocessing import resource_tracker
+
+        super().__init__(workers, chunk_size, timeout)
+        # Start the resource tracker before the workers so they share it;
+        # otherwise each worker's own tracker unlinks the block when it exits
+        resource_tracker.ensure_running()
+        self.context = multiprocessing.get_context(context)
+        self.pool = self.context.Pool(self.workers)
+        self.shm = None
+
+    def _share(self, x):
+        # Reuse the block while the population fits; grow it when it does not
+        from multiprocessing import shared_memory
+
+        if self.shm is None or self.shm.size < x.nbytes:
+            self._release()
+            self.shm = shared_memory.SharedMemory(create=True, size=max(x.nbytes, 1))
+        np.ndarray(x.shape, dtype=x.dtype, buffer=self.shm.buf)[...] = x
+
+    def _submit(self, objective, x, bounds):
+        self._share(x)
+        args = (objective, self.shm.name, x.shape, x.dtype.str)
+        return [self.pool.apply_async(_evaluate_shared, args + (start, stop)) for start, stop in bounds]
+
+    def _result(self, async_result, timeout):
+        return async_result.get(timeout)
+
+    def submit(self, objective, x):
+        # A few rows are cheaper to pickle than to stage in shared memory. The
+        # future is marked running so that an abandoned wait cannot cancel it
+        # under the pool's result thread, which would then fail to resolve it
+        future = Future()
+        future.set_running_or_notify_cancel()
+        self.pool.apply_async(_evaluate_rows, (objective, x, 0, len(x)),
+                              callback=future.set_result, error_callback=future.set_exception)
+        return future
+
+    def _on_timeout(self):
+        # Stuck workers cannot be cancelled one by one: replace the pool
+        self.pool.terminate()
+        self.pool.join()
+        self.pool = self.context.Pool(self.workers)
+
+    def _release(self):
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+    def close(self):
+        self.pool.terminate()
+        self.pool.join()
+        self._release()
@@ -0,0 +1,101 @@
+import argparse
+import functools
+import multiprocessing
+import os
+from dataclasses import dataclass, field, replace
+from typing import Any, List
+
+import numpy as np
+
+from .core import Result, seed_sequence
+
+# --- Independent-run experiments ---
+# run_replicas() runs R seeded replicas of one optimizer in a single
+# interpreter: in this process (workers=1) or spread over a process pool,
+# each replica in a worker that imports NumPy once and then runs many
+# replicas. Replica i draws from the i-th child of SeedSequence(seed).spawn(R),
+# so the streams are independent and the whole experiment is reproducible
+# from one seed, whatever the worker count. The Experiment holds each run's
+# Result, the (R, iterations) convergence curves and summary statistics.
+# `args` go to the optimizer positionally, before the config (the distance
+# provider for AntColonyOptimizer).
+
+@dataclass
+class Experiment:
+    results: List[Result]
+    maximize: bool
+    seeds: List[Any] = field(default_factory=list)
+
+    @property
+    def best_fitness(self):
+        return np.array([result.best_fitness for result in self.results])
+
+    @property
+    def curves(self):
+        # Best-so-far fitness per run (rows) and iteration (columns); runs
+        # that stopped early hold their last value
+        length = max(len(result.history) for result in self.results)
+        return np.array([result.history + result.history[-1:] * (length - len(result.history))
+                         for result in self.results])
+
+    @property
+    def best(self):
+        fitness = self.best_fitness
+        return self.results[int(np.argmax(fitness) if self.maximize else np.argmin(fitness))]
+
+    def summary(self):
+        fitness = self.best_fitness
+        q1, median, q3 = np.percentile(fitness, [25, 50, 75])
+        return {
+            "runs": len(fitness),
+            "mean": float(fitness.mean()),
+            "std": float(fitness.std(ddof=1)) if len(fitness) > 1 else 0.0,
+            "best": float(fitness.max() if self.maximize else fitness.min()),
+            "worst": float(fitness.min() if self.maximize else fitness.max()),
+            "median": float(median),
+            "q1": float(q1),
+            "q3": float(q3),
+            "mean_evaluations": float(np.mean([result.evaluations for result in self.results])),
+        }
+
+def _replica(optimizer_class, args, config, objective, iterations, seed):
+    kwargs = {} if objective is None else {"objective": objective}
+    optimizer = optimizer_class(*args, config, rng=seed, **kwargs)
+    return optimizer.run(iterations)
+
+def run_replicas(optimizer_class, runs=30, *, args=(), config=None, objective=None, seed=None, workers=1,
+                 iterations=None, context=None, **overrides):
+    if config is None:
+        config = optimizer_class.config_class(**overrides)
+    elif overrides:
+        config = replace(config, **overrides)
+    seeds = seed_sequence(seed).spawn(runs)
+    replica = functools.partial(_replica, optimizer_class, tuple(args), config, objective, iterations)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        results = [replica(s) for s in seeds]
+    else:
+        with multiprocessing.get_context(context).Pool(workers) as pool:
+            results = pool.map(replica, seeds, chunksize=max(1, runs // (4 * workers)))
+    return Experiment(results, optimizer_class.maximize, seeds)
+
+def main(argv=None):
+    import bioinspired
+
+    parser = argparse.ArgumentParser(description="Run independent seeded replicas of an optimizer.")
+    parser.add_argument("optimizer", help="class name, e.g. GeneticAlgorithm")
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=0, help="processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--iterations", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    optimizer_class = getattr(bioinspired, args.optimizer)
+    experiment = run_replicas(optimizer_class, args.runs, seed=args.seed, iterations=args.iterations,
+                              workers=args.workers)
+    for name, value in experiment.summary().items():
+        print(f"{name:>17}: {value:.6g}")
+
+if __name__ == "__main__":
+    main()
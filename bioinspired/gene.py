@@ -0,0 +1,131 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from .core import Config, Optimizer
+from .objectives import sine_wave
+
+# --- Gene expression GA (Lab 7) ---
+# A chromosome of num_genes genes is expressed as the mean of its genes and
+# the objective is evaluated on that expression. Reproduction is batched:
+# one-point crossover for every pair at once (a column-index mask per pair),
+# mutation with one Bernoulli mask and one noise matrix, all written into
+# preallocated buffers. Selection copies the population into `selected` and
+# reproduction writes the children back over the population, so the two
+# (pop_size x num_genes) buffers just trade roles every generation.
+
+@dataclass
+class GeneConfig(Config):
+    max_iter: int = 100
+    pop_size: int = 50
+    num_genes: int = 10
+    mutation_rate: float = 0.1
+    crossover_rate: float = 0.8
+    mutation_step: float = 0.2
+    lower: float = -1.0
+    upper: float = 2.0
+
+class GeneExpressionAlgorithm(Optimizer):
+    config_class = GeneConfig
+    default_objective = staticmethod(sine_wave)
+    phases = ("select", "crossover", "mutate", "evaluate_fitness")
+
+    def setup(self):
+        c = self.config
+        pairs = (c.pop_size + 1) // 2
+        self.population = self.rng.uniform(c.lower, c.upper, (c.pop_size, c.num_genes))
+
+        # An odd population pairs its last parent with the first one
+        self.selected = np.empty((2 * pairs, c.num_genes))
+        self.columns = np.arange(c.num_genes)
+        self.point = np.empty((pairs, 1))
+        self.fire = np.empty((pairs, 1))
+        self.take_first = np.empty((pairs, c.num_genes), dtype=bool)
+        self.noise = np.empty((c.pop_size, c.num_genes))
+        self.mutate_mask = np.empty((c.pop_size, c.num_genes), dtype=bool)
+
+        self.fitness = self.evaluate_fitness(self.population)
+        self.update_best(self.population, self.fitness)
+
+    @staticmethod
+    def express(pop):
+        return np.mean(pop, axis=1)  # Gene expression: average
+
+    def evaluate_fitness(self, pop):
+        return self.evaluate(self.express(pop)[:, None])
+
+    def selection_weights(self):
+        # Non-negative selection weights, shifted over the finite fitness
+        # only; non-finite fitness (an evaluation that timed out) gets none
+        finite = np.isfinite(self.fitness)
+        if not finite.any():
+            return np.ones(len(self.fitness))
+        if self.maximize:
+            fitness_shifted = self.fitness - np.min(self.fitness[finite]) + 1e-10
+        else:
+            fitness_shifted = np.max(self.fitness[finite]) - self.fitness + 1e-10
+        return fitness_shifted if finite.all() else np.where(finite, fitness_shifted, 0.0)
+
+    def select(self):
+        fitness_shifted = self.selection_weights()
+        probs = fitness_shifted / np.sum(fitness_shifted)
+        idx = self.rng.choice(self.config.pop_size, size=self.config.pop_size, p=probs)
+        np.take(self.population, idx, axis=0, out=self.selected[:self.config.pop_size])
+        if self.config.pop_size % 2:
+            self.selected[-1] = self.selected[0]
+
+    def crossover(self, out):
+        parent1 = self.selected[0::2]
+        parent2 = self.selected[1::2]
+
+        # Genes left of the cut come from the first parent; pairs where
+        # crossover does not fire copy their parents unchanged
+        self.rng.random(out=self.point)
+        self.point *= self.config.num_genes - 1
+        np.floor(self.point, out=self.point)
+        self.point += 1
+        np.less(self.columns, self.point, out=self.take_first)
+        self.rng.random(out=self.fire)
+        np.logical_or(self.take_first, self.fire >= self.config.crossover_rate, out=self.take_first)
+
+        child1 = out[0::2]
+        np.copyto(child1, parent2)
+        np.copyto(child1, parent1, where=self.take_first)
+
+        child2 = out[1::2]
+        n = len(child2)
+        np.copyto(child2, parent1[:n])
+        np.copyto(child2, parent2[:n], where=self.take_first[:n])
+
+    def mutate(self, out):
+        c = self.config
+        self.rng.random(out=self.noise)
+        np.less(self.noise, c.mutation_rate, out=self.mutate_mask)
+        self.rng.random(out=self.noise)
+        self.noise *= 2 * c.mutation_step
+        self.noise -= c.mutation_step
+        np.add(out, self.noise, out=out, where=self.mutate_mask)
+        np.clip(out, c.lower, c.upper, out=out)
+
+    def _step(self):
+        # Overwrites the population in place with its offspring
+        self.select()
+        self.crossover(self.population)
+        self.mutate(self.population)
+        self.fitness = self.evaluate_fitness(self.population)
+        self.update_best(self.population, self.fitness)
+
+def main():
+    optimizer = GeneExpressionAlgorithm()
+    for generation in range(optimizer.config.max_iter):
+        optimizer.step()
+        if generation % 10 == 0:
+            print(f"Generation {generation} → Best Fitness: {optimizer.best_fitness:.5f}")
+
+    result = optimizer.result()
+    print("\n=== Final Result ===")
+    print(f"Best Solution (x): {GeneExpressionAlgorithm.express(result.best_position[None, :])[0]}")
+    print(f"Best Fitness: {result.best_fitness:.5f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from .core import BoxConfig, Optimizer, box_bounds
+from .objectives import sine_wave
+
+# --- Genetic algorithm (Lab 1) ---
+# The whole population is one (pop_size, dimensions) float64 array; fitness,
+# roulette selection, blend crossover and bounded mutation are batched array
+# operations per generation.
+
+@dataclass
+class GeneticConfig(BoxConfig):
+    pop_size: int = 20
+    cross_rate: float = 0.7
+    mut_rate: float = 0.1
+    mutation_step: float = 0.1
+
+class GeneticAlgorithm(Optimizer):
+    config_class = GeneticConfig
+    default_objective = staticmethod(sine_wave)
+    phases = ("select", "crossover", "mutate", "evaluate")
+
+    def setup(self):
+        self.lower, self.upper = box_bounds(self.config)
+        self.population = self.rng.uniform(self.lower, self.upper, (self.config.pop_size, self.lower.size))
+        self.fitness = self.evaluate(self.population)
+        self.update_best(self.population, self.fitness)
+
+    def selection_weights(self):
+        # Roulette weights: the fitness, shifted to be non-negative when the
+        # objective can go below 0. The shift is taken over finite fitness
+        # only, and non-finite fitness (an evaluation that timed out) gets
+        # no weight.
+        finite = np.isfinite(self.fitness)
+        if not finite.any():
+            return np.ones(len(self.fitness))
+        low = self.fitness[finite].min()
+        weights = self.fitness if low >= 0 else self.fitness - low + 1e-10
+        return weights if finite.all() else np.where(finite, weights, 0.0)
+
+    def select(self):
+        # Roulette wheel: inverse-CDF lookup of uniform draws in the cumulative weights
+        cumulative = np.cumsum(self.selection_weights())
+        r = self.rng.random(len(self.population)) * cumulative[-1]
+        idx = np.searchsorted(cumulative, r, side='right')
+        return self.population[np.minimum(idx, len(self.population) - 1)]
+
+    def crossover(self, selected):
+        # Pair (i, i+1) produces child1 = blend(p1, p2) and child2 = blend(p2, p1)
+        n = len(selected)
+        pairs = np.arange(0, n, 2)
+        first = selected[pairs]
+        second = selected[(pairs + 1) % n]
+        parent1 = np.concatenate((first, second))[:n]
+        parent2 = np.concatenate((second, first))[:n]
+
+        fire = self.rng.random((n, 1)) < self.config.cross_rate
+        alpha = self.rng.random((n, 1))
+        return np.where(fire, alpha * parent1 + (1 - alpha) * parent2, parent1)
+
+    def mutate(self, children):
+        mask = self.rng.random(children.shape) < self.config.mut_rate
+        step = self.config.mutation_step
+        children[mask] += self.rng.uniform(-step, step, np.count_nonzero(mask))
+        np.clip(children, self.lower, self.upper, out=children)  # keep within bounds
+        return children
+
+    def _step(self):
+        self.population = self.mutate(self.crossover(self.select()))
+        self.fitness = self.evaluate(self.population)
+        self.update_best(self.population, self.fitness)
+
+def main():
+    result = GeneticAlgorithm().run(verbose=True)
+    print("\n=== Final Result ===")
+    print(f"Best solution x = {np.array2string(result.best_position, precision=5)}")
+    print(f"Best fitness = {result.best_fitness:.5f}")
+
+if __name__ == "__main__":
+    main()
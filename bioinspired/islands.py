@@ -0,0 +1,196 @@
+import functools
+import multiprocessing
+from dataclasses import replace
+
+import numpy as np
+
+from .core import Result, seed_sequence
+
+# --- Island model ---
+# `islands` independent copies of one optimizer each evolve their own
+# sub-population in a worker process. Every `migration_interval` iterations
+# the islands pause, each one sends its best `migrants` individuals (an
+# (m, dimensions) position array and an (m,) fitness array down a pipe) and
+# the coordinator routes them over the topology:
+#   ring    island i -> island i + 1
+#   full    every island -> every other island
+#   random  every island -> one other island, drawn afresh each migration
+# A destination keeps the best `migrants` of what it receives and
+# immigrate() puts them in place of its worst individuals. Islands only sync
+# at migrations, so the work spreads over the cores with little
+# coordination. Migration needs the optimizer's emigrants()/immigrate()
+# (GeneticAlgorithm, GeneExpressionAlgorithm, ParticleSwarm,
+# CellularOptimizer). With processes=False the islands run one after the
+# other in this process (for objectives that cannot be pickled). Each island
+# applies the config's termination criteria to itself. An island that has
+# met one stops stepping (its last emigrants still migrate out) and the
+# model stops at the first migration point where every island has. The
+# result's iterations and evaluations are totals over the islands, and its
+# termination names every criterion the islands stopped on.
+
+TOPOLOGIES = ("ring", "full", "random")
+
+def migration_routes(topology, islands, rng):
+    # Source islands for each destination
+    if topology == "ring":
+        return [[(i - 1) % islands] for i in range(islands)]
+    if topology == "full":
+        return [[j for j in range(islands) if j != i] for i in range(islands)]
+    if topology == "random":
+        sources = [[] for _ in range(islands)]
+        for i in range(islands):
+            j = (i + rng.integers(1, islands)) % islands
+            sources[j].append(i)
+        return sources
+    raise ValueError(f"unknown topology {topology!r}, expected one of {TOPOLOGIES}")
+
+def _handle(optimizer, command, args):
+    if command == "run":
+        iterations, migrants = args
+        optimizer.run(iterations)
+        return optimizer.best_fitness, optimizer.emigrants(migrants), optimizer.termination
+    if command == "immigrate":
+        return optimizer.immigrate(*args)
+    if command == "result":
+        return optimizer.result()
+    raise ValueError(f"unknown island command {command!r}")
+
+def _island_worker(connection, factory):
+    optimizer = factory()
+    while True:
+        command, args = connection.recv()
+        if command == "close":
+            break
+        try:
+            connection.send((True, _handle(optimizer, command, args)))
+        except Exception as exc:
+            connection.send((False, exc))
+    connection.close()
+
+class _LocalIsland:
+    def __init__(self, factory):
+        self.optimizer = factory()
+
+    def send(self, command, *args):
+        self.reply = _handle(self.optimizer, command, args)
+
+    def recv(self):
+        return self.reply
+
+    def close(self):
+        pass
+
+class _ProcessIsland:
+    def __init__(self, factory, context):
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=_island_worker, args=(child, factory), daemon=True)
+        self.process.start()
+        child.close()
+
+    def send(self, command, *args):
+        self.connection.send((command, args))
+
+    def recv(self):
+        ok, value = self.connection.recv()
+        if not ok:
+            raise value
+        return value
+
+    def close(self):
+        if self.process.is_alive():
+            self.connection.send(("close", ()))
+            self.process.join()
+        self.connection.close()
+
+class IslandModel:
+    def __init__(self, optimizer_class, islands=4, migration_interval=5, migrants=2, topology="ring",
+                 processes=True, *, config=None, objective=None, rng=None, context=None, **overrides):
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"unknown topology {topology!r}, expected one of {TOPOLOGIES}")
+        if config is None:
+            config = optimizer_class.config_class(**overrides)
+        elif overrides:
+            config = replace(config, **overrides)
+        self.config = config
+        self.maximize = optimizer_class.maximize
+        self.migration_interval = migration_interval
+        self.migrants = migrants
+        self.topology = topology
+
+        # Every island gets its own stream; migration draws come from the root
+        seed = seed_sequence(rng)
+        island_seeds = seed.spawn(islands)
+        self.rng = rng if isinstance(rng, np.random.Generator) else np.random.default_rng(seed)
+
+        context = multiprocessing.get_context(context)
+        self.islands = []
+        for island_seed in island_seeds:
+            factory = functools.partial(optimizer_class, config, objective=objective, rng=island_seed)
+            self.islands.append(_ProcessIsland(factory, context) if processes else _LocalIsland(factory))
+
+    def _broadcast(self, command, *args, islands=None):
+        islands = self.islands if islands is None else islands
+        for island in islands:
+            island.send(command, *args)
+        return [island.recv() for island in islands]
+
+    def migrate(self, outgoing, active=None):
+        # Only the islands in `active` (all by default) take in immigrants
+        routes = migration_routes(self.topology, len(self.islands), self.rng)
+        receiving = [(island, sources) for i, (island, sources) in enumerate(zip(self.islands, routes))
+                     if sources and (active is None or active[i])]
+        for island, sources in receiving:
+            positions = np.concatenate([outgoing[j][0] for j in sources])
+            fitness = np.concatenate([outgoing[j][1] for j in sources])
+            order = np.argsort(-fitness if self.maximize else fitness)[:self.migrants]
+            island.send("immigrate", positions[order], fitness[order])
+        for island, _ in receiving:
+            island.recv()
+
+    def run(self, iterations=None, verbose=False):
+        iterations = self.config.max_iter if iterations is None else iterations
+        done = 0
+        # Last (best_fitness, emigrants, termination) of every island
+        replies = [None] * len(self.islands)
+        while done < iterations:
+            epoch = min(self.migration_interval, iterations - done)
+            active = [reply is None or reply[2] is None for reply in replies]
+            running = [i for i, is_active in enumerate(active) if is_active]
+            for i, reply in zip(running, self._broadcast("run", epoch, self.migrants,
+                                                         islands=[self.islands[i] for i in running])):
+                replies[i] = reply
+            done += epoch
+            if verbose:
+                best = (max if self.maximize else min)(fitness for fitness, _, _ in replies)
+                print(f"Iteration {done}: Best Fitness = {best:.5f}")
+            if all(termination is not None for _, _, termination in replies):
+                break
+            if done < iterations and self.migrants > 0 and len(self.islands) > 1:
+                active = [termination is None for _, _, termination in replies]
+                self.migrate([emigrants for _, emigrants, _ in replies], active)
+        return self.result()
+
+    def result(self):
+        self.results = self._broadcast("result")
+        pick = max if self.maximize else min
+        best = pick(self.results, key=lambda result: result.best_fitness)
+        # Best fitness over all islands after each iteration; islands that
+        # stopped early hold their last value
+        length = max(len(result.history) for result in self.results)
+        history = np.array([result.history + result.history[-1:] * (length - len(result.history))
+                            for result in self.results])
+        combined = history.max(axis=0) if self.maximize else history.min(axis=0)
+        termination = ", ".join(sorted({result.termination for result in self.results}))
+        return Result(best.best_position, best.best_fitness, sum(result.iterations for result in self.results),
+                      sum(result.evaluations for result in self.results), self.maximize, combined.tolist(),
+                      termination)
+
+    def close(self):
+        for island in self.islands:
+            island.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
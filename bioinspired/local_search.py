@@ -0,0 +1,138 @@
+from collections import deque
+
+import numpy as np
+
+# --- Local search stage: 2-opt and Or-opt on neighbour lists ---
+# Moves are only tried between a city and its k nearest neighbours, every
+# move's gain is an O(1) delta of the edges it removes and adds, and
+# don't-look bits skip cities whose neighbourhood has not changed since
+# they last failed to improve. Tours come in and go out closed (n+1 long).
+
+EPS = 1e-9
+
+class LocalSearch:
+    def __init__(self, distances, candidates, or_opt=True, max_segment=3):
+        self.distances = distances
+        self.candidates = [row.tolist() for row in candidates]
+        self.or_opt = or_opt
+        self.max_segment = max_segment
+
+    def __call__(self, path):
+        return self.improve(path)
+
+    def improve(self, path):
+        tour = np.array(path[:-1], dtype=np.intp)
+        n = len(tour)
+        if n < 5:
+            return np.asarray(path)
+        self.tour = tour
+        self.pos = np.empty(n, dtype=np.intp)
+        self.pos[tour] = np.arange(n)
+        self.n = n
+
+        # Don't-look bits: only cities in the queue are examined
+        queued = np.ones(n, dtype=bool)
+        queue = deque(tour.tolist())
+        while queue:
+            a = queue.popleft()
+            queued[a] = False
+            touched = self._two_opt(a)
+            if touched is None and self.or_opt:
+                touched = self._or_opt(a)
+            if touched is not None:
+                for city in touched:
+                    if not queued[city]:
+                        queued[city] = True
+                        queue.append(city)
+
+        return np.append(self.tour, self.tour[0])
+
+    def _succ(self, city):
+        return int(self.tour[(self.pos[city] + 1) % self.n])
+
+    def _pred(self, city):
+        return int(self.tour[(self.pos[city] - 1) % self.n])
+
+    def _reverse(self, i, j):
+        # Reverse the cyclic segment of positions i..j; the complementary
+        # segment gives the same tour, so always flip the shorter one
+        n = self.n
+        length = (j - i) % n + 1
+        if 2 * length > n:
+            i, j = (j + 1) % n, (i - 1) % n
+            length = n - length
+        idx = (i + np.arange(length)) % n
+        self.tour[idx] = self.tour[idx[::-1]]
+        self.pos[self.tour[idx]] = idx
+
+    def _two_opt(self, a):
+        d = self.distances.d
+        for forward in (True, False):
+            b = self._succ(a) if forward else self._pred(a)
+            d_ab = d(a, b)
+            for c in self.candidates[a]:
+                d_ac = d(a, c)
+                if d_ac >= d_ab:
+                    break  # candidates are sorted, no later c can gain
+                e = self._succ(c) if forward else self._pred(c)
+                if c == b or e == a:
+                    continue
+                gain = d_ab + d(c, e) - d_ac - d(b, e)
+                if gain > EPS:
+                    if forward:
+                        # a b ... c e  ->  a c ... b e
+                        self._reverse(self.pos[b], self.pos[c])
+                    else:
+                        # e c ... b a  ->  e b ... c a
+                        self._reverse(self.pos[c], self.pos[b])
+                    return a, b, c, e
+        return None
+
+    def _or_opt(self, a):
+        # Move the segment starting at a (1..max_segment cities) between a
+        # neighbour c and its successor, possibly reversed
+        d = self.distances.d
+        n = self.n
+        for length in range(1, self.max_segment + 1):
+            if length >= n - 2:
+                break
+            first = a
+            last = int(self.tour[(self.pos[a] + length - 1) % n])
+            p = self._pred(first)
+            nx = self._succ(last)
+            removal_gain = d(p, first) + d(last, nx) - d(p, nx)
+            if removal_gain <= EPS:
+                continue
+
+            for end in (first, last):
+                for c in self.candidates[end]:
+                    if (self.pos[c] - self.pos[first]) % n < length or c == p:
+                        continue
+                    e = self._succ(c)
+                    d_ce = d(c, e)
+                    gain_forward = removal_gain - (d(c, first) + d(last, e) - d_ce)
+                    gain_reversed = removal_gain - (d(c, last) + d(first, e) - d_ce)
+                    if max(gain_forward, gain_reversed) > EPS:
+                        self._move_segment(first, length, c, reverse=gain_reversed > gain_forward)
+                        return first, last, p, nx, c, e
+        return None
+
+    def _reverse_path(self, outside, start, end):
+        # Reverse the path start..end that leads away from its neighbour
+        # `outside` (the tour's orientation flips when _reverse takes the
+        # complement, so it is read off the neighbours each time)
+        if self._succ(outside) == start:
+            self._reverse(self.pos[start], self.pos[end])
+        else:
+            self._reverse(self.pos[end], self.pos[start])
+
+    def _move_segment(self, first, length, c, reverse):
+        # p first..last nx .. c e  ->  p nx .. c [first..last] e as three
+        # 2-opt reversals (two when the segment goes in reversed)
+        p = self._pred(first)
+        last = int(self.tour[(self.pos[first] + length - 1) % self.n])
+        nx = self._succ(last)
+        self._reverse_path(p, first, c)        # p c .. nx last..first e
+        self._reverse_path(p, c, nx)           # p nx .. c last..first e
+        if not reverse:
+            self._reverse_path(c, last, first)  # p nx .. c first..last e
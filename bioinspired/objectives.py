@@ -0,0 +1,120 @@
+import numpy as np
+
+# --- Objective protocol ---
+# A batched objective takes a (pop, dims) array and returns a (pop,) array,
+# and says so with `vectorized = True` (the @vectorized decorator). A scalar
+# objective takes one candidate, always as a (dims,) row, and returns a
+# number (`vectorized = False`, @scalar). A function of one plain float, like
+# the labs' math.sin fitness functions, says so with @univariate and is
+# handed row[0] instead; that needs dims == 1. Optimizers pass every
+# objective through batch_objective(), which lifts scalar ones row by row
+# (ScalarObjective); a pool evaluator then spreads those rows over its
+# workers in chunks. Callables that declare nothing are taken as scalar, so
+# only objectives that opt in with @vectorized see the whole population.
+# Whatever the objective, check_fitness() makes sure one value per candidate
+# came back.
+
+def vectorized(function):
+    function.vectorized = True
+    return function
+
+def scalar(function):
+    function.vectorized = False
+    return function
+
+def univariate(function):
+    function.vectorized = False
+    function.univariate = True
+    return function
+
+class ScalarObjective:
+    vectorized = True
+
+    def __init__(self, function):
+        self.function = function
+        self.univariate = getattr(function, "univariate", False)
+
+    def __call__(self, x):
+        x = np.asarray(x)
+        if self.univariate:
+            if x.shape[-1] != 1:
+                raise ValueError(f"@univariate objective called on {x.shape[-1]}-dimensional candidates")
+            x = x[:, 0]
+        return np.fromiter((self._value(row) for row in x), dtype=float, count=len(x))
+
+    def _value(self, row):
+        # A number, or a one-element array of one
+        value = np.asarray(self.function(row))
+        if value.size != 1:
+            raise ValueError(f"scalar objective returned {value.size} values for one candidate")
+        return value.item()
+
+def batch_objective(objective):
+    return objective if getattr(objective, "vectorized", False) else ScalarObjective(objective)
+
+def check_fitness(fitness, count):
+    fitness = np.asarray(fitness, dtype=float)
+    if fitness.shape != (count,):
+        raise ValueError(f"objective returned fitness of shape {fitness.shape} for {count} candidates, "
+                         f"expected ({count},); mark batched objectives with @vectorized")
+    return fitness
+
+# --- Objective functions used by the labs ---
+# Batched: x is (pop, dims) and the result is one value per row.
+
+@vectorized
+def sine_wave(x):
+    # x * sin(10*pi*x) + 1 (maximize), summed over dimensions
+    return np.sum(x * np.sin(10 * np.pi * x) + 1, axis=-1)
+
+@vectorized
+def sphere(x):
+    # sum(x_i^2) (minimize)
+    return np.sum(x ** 2, axis=-1)
+
+# --- Standard test functions (minimize, optimum 0) ---
+# Batched like the above, in any number of dimensions. TEST_FUNCTIONS maps a
+# name to (function, lower, upper), the usual search box for every dimension.
+
+@vectorized
+def rastrigin(x):
+    return 10 * x.shape[-1] + np.sum(x ** 2 - 10 * np.cos(2 * np.pi * x), axis=-1)
+
+@vectorized
+def rosenbrock(x):
+    return np.sum(100 * (x[..., 1:] - x[..., :-1] ** 2) ** 2 + (1 - x[..., :-1]) ** 2, axis=-1)
+
+@vectorized
+def ackley(x):
+    n = x.shape[-1]
+    return (-20 * np.exp(-0.2 * np.sqrt(np.sum(x ** 2, axis=-1) / n))
+            - np.exp(np.sum(np.cos(2 * np.pi * x), axis=-1) / n) + 20 + np.e)
+
+@vectorized
+def griewank(x):
+    i = np.sqrt(np.arange(1, x.shape[-1] + 1))
+    return 1 + np.sum(x ** 2, axis=-1) / 4000 - np.prod(np.cos(x / i), axis=-1)
+
+@vectorized
+def schwefel(x):
+    return 418.9828872724339 * x.shape[-1] - np.sum(x * np.sin(np.sqrt(np.abs(x))), axis=-1)
+
+TEST_FUNCTIONS = {
+    "sphere": (sphere, -5.12, 5.12),
+    "rastrigin": (rastrigin, -5.12, 5.12),
+    "rosenbrock": (rosenbrock, -5.0, 10.0),
+    "ackley": (ackley, -32.768, 32.768),
+    "griewank": (griewank, -600.0, 600.0),
+    "schwefel": (schwefel, -500.0, 500.0),
+}
+
+class Negated:
+    # -f, for running a minimization problem on a maximizing optimizer;
+    # a class rather than a lambda so that it pickles for process pools
+    vectorized = True
+
+    def __init__(self, function):
+        self.function = batch_objective(function)
+
+    def __call__(self, x):
+        return -self.function(x)
@@ -0,0 +1,110 @@
+import time
+
+import numpy as np
+
+# --- Per-phase timing ---
+# `with profile(optimizer) as profiler: optimizer.run()` times the phases
+# the optimizer lists in `phases` (select/crossover/mutate/evaluate for the
+# GA, construct_solution(s)/evaluate/update_pheromones for the ACO, ...) plus
+# `_step` as the whole iteration. For the duration of the block each phase
+# method is shadowed by a timing wrapper on the instance; outside it nothing
+# is wrapped, so profiling costs nothing when it is off. Phase times are
+# inclusive: a phase that calls another (update_cell -> evaluate) counts the
+# inner time too.
+#   profiler.report()        {phase: {calls, total, mean, share}}; share is
+#                            the fraction of the total iteration time
+#   profiler.per_iteration   (iterations, phases) seconds, columns in
+#                            profiler.names order
+#   profiler.format_report() the report as a text table
+# backend="cprofile" or "pyinstrument" (optional dependency) also runs that
+# profiler over the block; profiler.dump(path) writes a .prof file for
+# pstats/snakeviz or a pyinstrument session for `pyinstrument --load`.
+
+class PhaseProfiler:
+    def __init__(self, optimizer, phases=None, backend=None):
+        self.optimizer = optimizer
+        names = phases or optimizer.phases
+        self.names = [name for name in names if getattr(optimizer, name, None) is not None] + ["_step"]
+        self.calls = [0] * len(self.names)
+        self.totals = [0.0] * len(self.names)
+        self.rows = []
+        self.backend = backend
+        self.backend_profiler = None
+
+    def _wrap(self, index, method):
+        calls, totals = self.calls, self.totals
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                totals[index] += time.perf_counter() - start
+                calls[index] += 1
+                if index == len(totals) - 1:
+                    self.rows.append(list(totals))
+        return timed
+
+    def __enter__(self):
+        # Phases that are instance attributes (the ACO's local_search) are put back on exit
+        own = self.optimizer.__dict__
+        self.shadowed = {name: own[name] for name in self.names if name in own}
+        for index, name in enumerate(self.names):
+            setattr(self.optimizer, name, self._wrap(index, getattr(self.optimizer, name)))
+        if self.backend == "cprofile":
+            import cProfile
+            self.backend_profiler = cProfile.Profile()
+            self.backend_profiler.enable()
+        elif self.backend == "pyinstrument":
+            import pyinstrument
+            self.backend_profiler = pyinstrument.Profiler()
+            self.backend_profiler.start()
+        elif self.backend is not None:
+            raise ValueError(f"unknown profiling backend {self.backend!r}")
+        return self
+
+    def __exit__(self, *exc):
+        if self.backend == "cprofile":
+            self.backend_profiler.disable()
+        elif self.backend == "pyinstrument":
+            self.backend_profiler.stop()
+        for name in self.names:
+            if name in self.shadowed:
+                setattr(self.optimizer, name, self.shadowed[name])
+            else:
+                del self.optimizer.__dict__[name]
+
+    @property
+    def per_iteration(self):
+        cumulative = np.array(self.rows).reshape(-1, len(self.names))
+        return np.diff(cumulative, axis=0, prepend=np.zeros((1, len(self.names))))
+
+    def report(self):
+        iteration_total = self.totals[-1]
+        return {
+            name: {
+                "calls": calls,
+                "total": total,
+                "mean": total / calls if calls else 0.0,
+                "share": total / iteration_total if iteration_total else 0.0,
+            }
+            for name, calls, total in zip(self.names, self.calls, self.totals)
+        }
+
+    def format_report(self):
+        lines = [f"{'phase':<22} {'calls':>8} {'total s':>10} {'mean ms':>10} {'share':>7}"]
+        for name, row in self.report().items():
+            lines.append(f"{name:<22} {row['calls']:>8} {row['total']:>10.4f} "
+                         f"{1000 * row['mean']:>10.4f} {100 * row['share']:>6.1f}%")
+        return "\n".join(lines)
+
+    def dump(self, path):
+        if self.backend == "cprofile":
+            self.backend_profiler.dump_stats(path)
+        elif self.backend == "pyinstrument":
+            self.backend_profiler.last_session.save(path)
+        else:
+            raise ValueError("dump() needs backend='cprofile' or 'pyinstrument'")
+
+def profile(optimizer, phases=None, backend=None):
+    return PhaseProfiler(optimizer, phases, backend)
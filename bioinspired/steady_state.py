@@ -0,0 +1,182 @@
+import asyncio
+from collections import deque
+
+import numpy as np
+
+from .checkpoint import save_checkpoint
+from .gene import GeneExpressionAlgorithm
+from .genetic import GeneticAlgorithm
+from .objectives import check_fitness
+from .swarm import ParticleSwarm
+
+# --- Asynchronous steady-state mode (Lab 1, Lab 2, Lab 7) ---
+# The generational step() waits for every fitness of the population before
+# anyone moves on, so with uneven evaluation times the workers idle behind
+# the slowest one. Here `in_flight` single-candidate evaluations are kept
+# running on the evaluator (evaluator.submit, awaited through asyncio); as
+# soon as any one result arrives it is folded in and a new candidate is
+# submitted:
+#   SteadyStateGA / SteadyStateGeneExpression  breed one child from the
+#       current population; it replaces the worst individual if it is better
+#   AsyncParticleSwarm  update the particle's personal best and the global
+#       best, then move that particle from the current gbest and resubmit it
+# The budget is counted in evaluations (max_iter generations' worth by
+# default, the same as the generational run). Every population-sized batch
+# of results counts as one iteration for history and verbose output.
+# run() drives run_async() with asyncio.run(); await run_async() directly
+# from inside a running event loop. With the evaluator's `timeout` set, a
+# late candidate gets the worst fitness and its slot is refilled; the
+# worker itself is not interrupted. Termination criteria are checked at
+# each iteration boundary; when one is met no new candidates are submitted
+# and the evaluations already in flight are folded in. A checkpoint is saved
+# every `checkpoint_every` iterations and once more when the run ends; the
+# evaluations in flight at a save are not part of it, so a resumed run
+# proposes fresh candidates in their place.
+
+class SteadyStateMixin:
+    def generation_size(self):
+        return len(self.population)
+
+    def evaluation_rows(self, candidate):
+        # What the objective sees for one candidate
+        return candidate[None, :]
+
+    def propose(self):
+        # Return (key, candidate) for the next evaluation
+        raise NotImplementedError
+
+    def accept(self, key, candidate, fitness):
+        raise NotImplementedError
+
+    async def _evaluate_one(self, candidate, timeout):
+        future = asyncio.wrap_future(self.evaluator.submit(self.objective, self.evaluation_rows(candidate)))
+        try:
+            fitness = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return self.worst_fitness
+        return float(check_fitness(fitness, 1)[0])
+
+    async def run_async(self, iterations=None, in_flight=None, verbose=False, checkpoint=None,
+                        checkpoint_every=10):
+        iterations = self.config.max_iter - self.iteration if iterations is None else iterations
+        size = self.generation_size()
+        budget = iterations * size
+        if in_flight is None:
+            in_flight = getattr(self.evaluator, "workers", 1)
+        in_flight = max(1, min(in_flight, size, budget))
+        timeout = getattr(self.evaluator, "timeout", None)
+
+        pending = {}
+        submitted = completed = 0
+
+        def launch():
+            nonlocal submitted
+            key, candidate = self.propose()
+            task = asyncio.ensure_future(self._evaluate_one(candidate, timeout))
+            pending[task] = (key, candidate)
+            submitted += 1
+
+        while submitted < min(in_flight, budget):
+            launch()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                key, candidate = pending.pop(task)
+                self.evaluations += 1
+                self.accept(key, candidate, task.result())
+                completed += 1
+                if completed % size == 0:
+                    self.iteration += 1
+                    self.history.append(self.best_fitness)
+                    self.notify()
+                    if verbose:
+                        print(f"Iteration {self.iteration}: Best Fitness = {self.best_fitness:.5f}")
+                    self.termination = self.check_termination()
+                    if self.termination is not None:
+                        budget = submitted  # let the evaluations in flight finish
+                    elif checkpoint is not None and submitted < budget and self.iteration % checkpoint_every == 0:
+                        save_checkpoint(self, checkpoint)
+                if submitted < budget:
+                    launch()
+        if checkpoint is not None:
+            save_checkpoint(self, checkpoint)
+        for observer in self.observers:
+            observer.flush()
+        return self.result()
+
+    def run(self, iterations=None, verbose=False, checkpoint=None, checkpoint_every=10, in_flight=None):
+        return asyncio.run(self.run_async(iterations, in_flight, verbose, checkpoint, checkpoint_every))
+
+    def _replace_worst(self, candidate, fitness):
+        worst = np.argmin(self.fitness) if self.maximize else np.argmax(self.fitness)
+        if self.is_better(fitness, self.fitness[worst]):
+            self.population[worst] = candidate
+            self.fitness[worst] = fitness
+        self.update_best(candidate[None, :], np.array([fitness]))
+
+class SteadyStateGA(SteadyStateMixin, GeneticAlgorithm):
+    def propose(self):
+        # Roulette-pick two parents, blend them and mutate the first child
+        cumulative = np.cumsum(self.selection_weights())
+        idx = np.searchsorted(cumulative, self.rng.random(2) * cumulative[-1], side='right')
+        parents = self.population[np.minimum(idx, len(self.population) - 1)]
+        return None, self.mutate(self.crossover(parents))[0]
+
+    def accept(self, key, candidate, fitness):
+        self._replace_worst(candidate, fitness)
+
+class SteadyStateGeneExpression(SteadyStateMixin, GeneExpressionAlgorithm):
+    def evaluation_rows(self, candidate):
+        return self.express(candidate[None, :])[:, None]
+
+    def propose(self):
+        c = self.config
+        fitness_shifted = self.selection_weights()
+        parent1, parent2 = self.population[self.rng.choice(c.pop_size, size=2, p=fitness_shifted / np.sum(fitness_shifted))]
+
+        # One-point crossover, then per-gene mutation
+        child = parent1.copy()
+        if self.rng.random() < c.crossover_rate:
+            point = self.rng.integers(1, c.num_genes) if c.num_genes > 1 else 1
+            child[point:] = parent2[point:]
+        mask = self.rng.random(c.num_genes) < c.mutation_rate
+        child[mask] += self.rng.uniform(-c.mutation_step, c.mutation_step, np.count_nonzero(mask))
+        np.clip(child, c.lower, c.upper, out=child)
+        return None, child
+
+    def accept(self, key, candidate, fitness):
+        self._replace_worst(candidate, fitness)
+
+class AsyncParticleSwarm(SteadyStateMixin, ParticleSwarm):
+    def generation_size(self):
+        return len(self.position)
+
+    def setup(self):
+        super().setup()
+        # Particles without an evaluation in flight, moved and resubmitted in turn
+        self.idle = deque(range(len(self.position)))
+
+    def move_particle(self, i):
+        # The PSO equation for one particle, against the current global best
+        c = self.config
+        r1, r2 = self.rng.random((2, self.lower.size))
+        position, velocity = self.position[i], self.velocity[i]
+        velocity *= c.w
+        velocity += c.c1 * r1 * (self.best_position_per_particle[i] - position)
+        velocity += c.c2 * r2 * (self.best_position - position)
+        np.clip(velocity, -self.v_max, self.v_max, out=velocity)
+        position += velocity
+        np.clip(position, self.lower, self.upper, out=position)
+
+    def propose(self):
+        i = self.idle.popleft()
+        self.move_particle(i)
+        return i, self.position[i].copy()
+
+    def accept(self, i, candidate, fitness):
+        self.fitness[i] = fitness
+        if self.is_better(fitness, self.best_fitness_per_particle[i]):
+            self.best_fitness_per_particle[i] = fitness
+            self.best_position_per_particle[i] = candidate
+        self.update_best(candidate[None, :], np.array([fitness]))
+        self.idle.append(i)
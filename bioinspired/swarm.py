@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from .core import BoxConfig, Optimizer, box_bounds
+from .objectives import sine_wave
+
+# --- Particle swarm optimization (Lab 2) ---
+# Structure of arrays: position, velocity and best_position are
+# (num_particles, dimensions) arrays and best_fitness is (num_particles,),
+# so memory and time grow linearly with no per-particle object.
+
+@dataclass
+class SwarmConfig(BoxConfig):
+    num_particles: int = 30
+    w: float = 0.7           # inertia weight (controls exploration/exploitation)
+    c1: float = 1.5          # cognitive coefficient (particle's own best)
+    c2: float = 1.5          # social coefficient (global best)
+    v_max: Any = 0.1         # max velocity, scalar or per dimension
+
+class ParticleSwarm(Optimizer):
+    config_class = SwarmConfig
+    default_objective = staticmethod(sine_wave)
+    phases = ("move", "evaluate")
+
+    def setup(self):
+        self.lower, self.upper = box_bounds(self.config)
+        self.v_max = np.broadcast_to(np.asarray(self.config.v_max, dtype=float), self.lower.shape).copy()
+
+        shape = (self.config.num_particles, self.lower.size)
+        self.position = self.rng.uniform(self.lower, self.upper, shape)
+        self.velocity = self.rng.uniform(-self.v_max, self.v_max, shape)
+        self.best_position_per_particle = self.position.copy()
+        self.best_fitness_per_particle = self.evaluate(self.position)
+        self.fitness = self.best_fitness_per_particle.copy()  # of the current positions
+        self.update_best(self.position, self.best_fitness_per_particle)
+
+    def move(self):
+        # Velocity update (PSO equation), in place to avoid extra temporaries
+        c = self.config
+        r1 = self.rng.random(self.position.shape)
+        r2 = self.rng.random(self.position.shape)
+        self.velocity *= c.w
+        r1 *= c.c1
+        r1 *= self.best_position_per_particle - self.position
+        self.velocity += r1
+        r2 *= c.c2
+        r2 *= self.best_position - self.position
+        self.velocity += r2
+        np.clip(self.velocity, -self.v_max, self.v_max, out=self.velocity)
+
+        # Position update, kept within bounds
+        self.position += self.velocity
+        np.clip(self.position, self.lower, self.upper, out=self.position)
+
+    def _step(self):
+        self.move()
+        self.fitness = fitness = self.evaluate(self.position)
+
+        # Update personal and global bests
+        improved = self.is_better(fitness, self.best_fitness_per_particle)
+        self.best_fitness_per_particle[improved] = fitness[improved]
+        self.best_position_per_particle[improved] = self.position[improved]
+        self.update_best(self.position, fitness)
+
+    def current_population(self):
+        return self.position, self.fitness
+
+    def emigrants(self, count):
+        # Particles migrate as their personal bests
+        fitness = self.best_fitness_per_particle
+        order = np.argsort(-fitness if self.maximize else fitness)[:count]
+        return self.best_position_per_particle[order].copy(), fitness[order].copy()
+
+    def immigrate(self, positions, fitness):
+        fitness_per_particle = self.best_fitness_per_particle
+        order = np.argsort(fitness_per_particle if self.maximize else -fitness_per_particle)[:len(fitness)]
+        self.position[order] = positions
+        self.best_position_per_particle[order] = positions
+        fitness_per_particle[order] = fitness
+        self.update_best(positions, fitness)
+
+def main():
+    result = ParticleSwarm().run(verbose=True)
+    print("\n=== Final Result ===")
+    print(f"Best Position (x): {np.array2string(result.best_position, precision=5)}")
+    print(f"Best Fitness: {result.best_fitness:.5f}")
+
+if __name__ == "__main__":
+    main()
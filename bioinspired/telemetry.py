@@ -0,0 +1,110 @@
+import os
+
+import numpy as np
+
+# --- Convergence telemetry ---
+# Optimizers take `observers=[...]`. After every step() each observer whose
+# `stride` divides the iteration number gets optimizer.metrics(): one row of
+# FIELDS (iteration, best fitness, mean fitness of the current population,
+# diversity, evaluations so far, wall time since construction). Metrics are
+# only computed when some observer samples the iteration, so with no
+# observers (or NullSink) telemetry costs one empty loop per step.
+#   NullSink      discards everything
+#   MemorySink    rows in a growable float64 array; .array, sink["best"]
+#   CsvSink       appends buffered rows to a CSV file
+#   NpyChunkSink  writes every `chunk` rows as metrics-NNNNN.npy in a
+#                 directory; load_chunks() reads them back as one array
+#   ConsoleSink   prints "Iteration N: Best Fitness = ..." (replaces the
+#                 per-iteration print of run(verbose=True) at any stride)
+# The file sinks flush when their buffer fills and at the end of run().
+
+FIELDS = ("iteration", "best", "mean", "diversity", "evaluations", "time")
+
+class NullSink:
+    def __init__(self, stride=1):
+        self.stride = stride
+
+    def record(self, row):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class MemorySink(NullSink):
+    def __init__(self, stride=1, capacity=1024):
+        super().__init__(stride)
+        self.buffer = np.empty((capacity, len(FIELDS)))
+        self.size = 0
+
+    def record(self, row):
+        if self.size == len(self.buffer):
+            self.buffer = np.concatenate((self.buffer, np.empty_like(self.buffer)))
+        self.buffer[self.size] = row
+        self.size += 1
+
+    @property
+    def array(self):
+        return self.buffer[:self.size]
+
+    def __getitem__(self, name):
+        return self.array[:, FIELDS.index(name)]
+
+    def __len__(self):
+        return self.size
+
+class _FileSink(MemorySink):
+    def record(self, row):
+        super().record(row)
+        if self.size == len(self.buffer):
+            self.flush()
+
+    def flush(self):
+        if self.size:
+            self._write(self.array)
+            self.size = 0
+
+class CsvSink(_FileSink):
+    def __init__(self, path, stride=1, buffer_rows=1024):
+        super().__init__(stride, buffer_rows)
+        self.path = path
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, "w") as f:
+                f.write(",".join(FIELDS) + "\n")
+
+    def _write(self, rows):
+        with open(self.path, "a") as f:
+            np.savetxt(f, rows, delimiter=",", fmt="%.17g")
+
+class NpyChunkSink(_FileSink):
+    def __init__(self, directory, stride=1, chunk=1024):
+        super().__init__(stride, chunk)
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.chunks = len(chunk_files(directory))
+
+    def _write(self, rows):
+        np.save(os.path.join(self.directory, f"metrics-{self.chunks:05d}.npy"), rows)
+        self.chunks += 1
+
+def chunk_files(directory):
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                  if name.startswith("metrics-") and name.endswith(".npy"))
+
+def load_chunks(directory):
+    files = chunk_files(directory)
+    if not files:
+        return np.empty((0, len(FIELDS)))
+    return np.concatenate([np.load(path) for path in files])
+
+class ConsoleSink(NullSink):
+    def record(self, row):
+        print(f"Iteration {int(row[0])}: Best Fitness = {row[1]:.5f}")
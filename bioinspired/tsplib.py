@@ -0,0 +1,92 @@
+import numpy as np
+
+# --- TSPLIB reader ---
+# Supports .tsp files with NODE_COORD_SECTION (EUC_2D, CEIL_2D, ATT, GEO)
+# or EXPLICIT edge weights, and .opt.tour files. Other EDGE_WEIGHT_TYPEs
+# (MAN_2D, MAX_2D, EUC_3D, ...) are rejected rather than measured with the
+# wrong metric. City ids are returned 0-based.
+
+EDGE_WEIGHT_TYPES = ("EUC_2D", "CEIL_2D", "ATT", "GEO", "EXPLICIT")
+EXPLICIT_FORMATS = ("FULL_MATRIX", "UPPER_ROW", "LOWER_ROW", "UPPER_DIAG_ROW", "LOWER_DIAG_ROW")
+
+class TSPInstance:
+    def __init__(self, name, dimension, edge_weight_type, coords=None, matrix=None, comment=""):
+        self.name = name
+        self.dimension = dimension
+        self.edge_weight_type = edge_weight_type
+        self.coords = coords      # (n, 2) float64 array, or None for EXPLICIT instances
+        self.matrix = matrix      # (n, n) float32 array for EXPLICIT instances
+        self.comment = comment
+
+    def __repr__(self):
+        return f"TSPInstance({self.name!r}, dimension={self.dimension}, {self.edge_weight_type})"
+
+def _read_sections(path):
+    header = {}
+    sections = {}
+    current = None
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line == "EOF":
+                continue
+            if line.rstrip(":").strip().endswith("_SECTION"):
+                current = line.rstrip(":").strip()
+                sections[current] = []
+            elif ":" in line:
+                key, value = line.split(":", 1)
+                header[key.strip()] = value.strip()
+                current = None
+            elif current is not None:
+                sections[current].append(line)
+    return header, sections
+
+def _explicit_matrix(values, n, fmt):
+    matrix = np.zeros((n, n), dtype=np.float32)
+    if fmt == "FULL_MATRIX":
+        matrix[:] = values[:n * n].reshape(n, n)
+        return matrix
+
+    diag = fmt.endswith("DIAG_ROW")
+    if fmt.startswith("UPPER"):
+        rows, cols = np.triu_indices(n, 0 if diag else 1)
+    else:
+        rows, cols = np.tril_indices(n, 0 if diag else -1)
+    matrix[rows, cols] = values[:rows.size]
+    matrix[cols, rows] = values[:rows.size]
+    return matrix
+
+def load_tsp(path):
+    header, sections = _read_sections(path)
+    n = int(header["DIMENSION"])
+    edge_weight_type = header.get("EDGE_WEIGHT_TYPE", "EUC_2D")
+    if edge_weight_type not in EDGE_WEIGHT_TYPES:
+        raise ValueError(f"unsupported EDGE_WEIGHT_TYPE: {edge_weight_type}")
+
+    coords = None
+    matrix = None
+    if "NODE_COORD_SECTION" in sections:
+        rows = np.array([line.split() for line in sections["NODE_COORD_SECTION"][:n]], dtype=float)
+        coords = rows[:, 1:3]
+    if edge_weight_type == "EXPLICIT":
+        values = np.array(" ".join(sections["EDGE_WEIGHT_SECTION"]).split(), dtype=np.float32)
+        fmt = header.get("EDGE_WEIGHT_FORMAT", "FULL_MATRIX")
+        if fmt not in EXPLICIT_FORMATS:
+            raise ValueError(f"unsupported EDGE_WEIGHT_FORMAT: {fmt}")
+        matrix = _explicit_matrix(values, n, fmt)
+    elif coords is None:
+        raise ValueError(f"{path}: no NODE_COORD_SECTION")
+
+    return TSPInstance(header.get("NAME", str(path)), n, edge_weight_type,
+                       coords=coords, matrix=matrix, comment=header.get("COMMENT", ""))
+
+def load_tour(path):
+    # .opt.tour: TOUR_SECTION lists 1-based city ids terminated by -1
+    _, sections = _read_sections(path)
+    ids = []
+    for line in sections["TOUR_SECTION"]:
+        for token in line.split():
+            if int(token) == -1:
+                return np.array(ids, dtype=np.intp)
+            ids.append(int(token) - 1)
+    return np.array(ids, dtype=np.intp)
@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from .core import BoxConfig, Optimizer, box_bounds
+from .objectives import sine_wave
+
+# --- Grey wolf optimizer (Labs 4 and 5) ---
+# The pack is a (num_wolves, dimensions) array. The A/C coefficients for
+# alpha, beta and delta are drawn as one tensor, X1/X2/X3 come from
+# broadcasting against the stacked leader positions, and the leaders are the
+# top three found with argpartition instead of a full sort.
+
+def top_three(fitness, maximize=True):
+    # Indices of the three fittest wolves, best first (repeats if fewer than 3)
+    key = -fitness if maximize else fitness
+    k = min(3, fitness.size)
+    top = np.argpartition(key, k - 1)[:k]
+    top = top[np.argsort(key[top])]
+    return np.resize(top, 3)
+
+@dataclass
+class WolfConfig(BoxConfig):
+    num_wolves: int = 20
+
+class GreyWolfOptimizer(Optimizer):
+    config_class = WolfConfig
+    default_objective = staticmethod(sine_wave)
+    phases = ("evaluate", "update_leaders")
+
+    def setup(self):
+        self.lower, self.upper = box_bounds(self.config)
+        self.wolves = self.rng.uniform(self.lower, self.upper, (self.config.num_wolves, self.lower.size))
+        self.fitness = self.evaluate(self.wolves)
+        self.update_leaders()
+
+    def update_leaders(self):
+        top = top_three(self.fitness, self.maximize)
+        self.leaders = self.wolves[top]  # alpha, beta, delta positions, (3, dimensions)
+        self.update_best(self.wolves, self.fitness)
+
+    def _step(self):
+        a = 2 - self.iteration * (2 / self.config.max_iter)  # linearly decreases from 2 to 0
+
+        # A = 2a*r1 - a and C = 2*r2 for all three leaders, in one draw;
+        # the arithmetic below is done in place on the random tensor
+        r = self.rng.random((2, 3) + self.wolves.shape)
+        A, C = r[0], r[1]
+        A *= 2 * a
+        A -= a
+        C *= 2
+
+        # D = |C * X_leader - X|, then X_k = X_leader - A * D
+        leaders = self.leaders[:, None, :]
+        C *= leaders
+        C -= self.wolves
+        D = np.abs(C, out=C)
+        D *= A
+
+        # Average influence of alpha, beta, delta, kept within bounds
+        new_wolves = self.leaders.sum(axis=0) - D.sum(axis=0)
+        new_wolves /= 3
+        self.wolves = np.clip(new_wolves, self.lower, self.upper, out=new_wolves)
+        self.fitness = self.evaluate(self.wolves)
+        self.update_leaders()
+
+    def current_population(self):
+        return self.wolves, self.fitness
+
+def main():
+    result = GreyWolfOptimizer().run(verbose=True)
+    print("\n=== Final Result ===")
+    print(f"Best position (x): {np.array2string(result.best_position, precision=5)}")
+    print(f"Best fitness: {result.best_fitness:.5f}")
+
+if __name__ == "__main__":
+    main()